@@ -17,6 +17,32 @@ import {
   type SendMessageResponse,
 } from '../validation/schemas';
 
+// Static error payloads, built once at module scope instead of per failed
+// request; the HTTP status table replaces a per-call switch
+const STATUS_ERROR_MESSAGES: Record<number, string> = {
+  400: 'Invalid message format. Please check your input.',
+  401: 'Please log in to continue chatting.',
+  429: 'Rate limit exceeded. Please wait before sending another message.',
+  500: 'Server error. Please try again later.',
+};
+
+const DEFAULT_SEND_ERROR = 'Failed to send message. Please try again.';
+
+const TAB_TYPE_REQUIRED = Object.freeze({
+  success: false,
+  error: 'Tab type is required',
+});
+
+const CLEAR_HISTORY_FAILED = Object.freeze({
+  success: false,
+  error: 'Failed to clear chat history',
+});
+
+const EXPORT_HISTORY_FAILED = Object.freeze({
+  success: false,
+  error: 'Failed to export chat history',
+});
+
 /**
  * Send a chat message to the AI tutor
  */
@@ -24,22 +50,24 @@ export async function sendChatMessageAction(
   prevState: MessageActionState | null,
   formData: FormData
 ): Promise<MessageActionState> {
-  try {
-    // Validate form data
-    const validation = validateFormData(SendMessageSchema, formData);
-    
-    if (!validation.success) {
-      return {
-        ...createValidationError(
-          validation.error || 'Invalid message data',
-          validation.details
-        ),
-        message: null,
-      };
-    }
+  // Validate form data synchronously before any async work; safeParse-based
+  // validation never throws, so malformed input returns without entering
+  // the try/await machinery
+  const validation = validateFormData(SendMessageSchema, formData);
+
+  if (!validation.success) {
+    return {
+      ...createValidationError(
+        validation.error || 'Invalid message data',
+        validation.details
+      ),
+      message: null,
+    };
+  }
 
-    const requestData: SendMessageRequest = validation.data!;
+  const requestData: SendMessageRequest = validation.data!;
 
+  try {
     // TODO: Replace with Next.js API route call
     // const response = await fetch('/api/chat/send', { method: 'POST', body: JSON.stringify(requestData) });
     throw new Error('Chat API not implemented - replace FastAPI with Next.js API routes');
@@ -60,25 +88,12 @@ export async function sendChatMessageAction(
   } catch (error) {
     console.error('Failed to send chat message:', error);
     
-    let errorMessage = 'Failed to send message. Please try again.';
+    let errorMessage = DEFAULT_SEND_ERROR;
     
-    if (error instanceof Error) {
-      if ('status' in error) {
-        const status = (error as ApiErrorResponse).status;
-        switch (status) {
-          case 400:
-            errorMessage = 'Invalid message format. Please check your input.';
-            break;
-          case 401:
-            errorMessage = 'Please log in to continue chatting.';
-            break;
-          case 429:
-            errorMessage = 'Rate limit exceeded. Please wait before sending another message.';
-            break;
-          case 500:
-            errorMessage = 'Server error. Please try again later.';
-            break;
-        }
+    if (error instanceof Error && 'status' in error) {
+      const status = (error as ApiErrorResponse).status;
+      if (status !== undefined && status in STATUS_ERROR_MESSAGES) {
+        errorMessage = STATUS_ERROR_MESSAGES[status];
       }
     }
 
@@ -133,10 +148,7 @@ export async function clearChatHistoryAction(
     const tabType = formData.get('tabType')?.toString();
     
     if (!tabType) {
-      return {
-        success: false,
-        error: 'Tab type is required',
-      };
+      return TAB_TYPE_REQUIRED;
     }
 
     // TODO: Replace with Next.js API route call
@@ -153,10 +165,7 @@ export async function clearChatHistoryAction(
   } catch (error) {
     console.error('Failed to clear chat history:', error);
     
-    return {
-      success: false,
-      error: 'Failed to clear chat history',
-    };
+    return CLEAR_HISTORY_FAILED;
   }
 }
 
@@ -172,10 +181,7 @@ export async function exportChatHistoryAction(
     const format = formData.get('format')?.toString() || 'json';
     
     if (!tabType) {
-      return {
-        success: false,
-        error: 'Tab type is required',
-      };
+      return TAB_TYPE_REQUIRED;
     }
 
     // TODO: Replace with Next.js API route call
@@ -189,9 +195,6 @@ export async function exportChatHistoryAction(
   } catch (error) {
     console.error('Failed to export chat history:', error);
     
-    return {
-      success: false,
-      error: 'Failed to export chat history',
-    };
+    return EXPORT_HISTORY_FAILED;
   }
 }
\ No newline at end of file
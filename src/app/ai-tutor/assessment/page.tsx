@@ -44,40 +44,37 @@ export const metadata: Metadata = {
   }
 };
 
-// Generate structured data for SEO
-function generateStructuredData() {
-  return {
-    "@context": "https://schema.org",
-    "@type": "Quiz",
-    "name": "Programming Skill Assessments",
-    "description": "Comprehensive skill assessments covering frontend development, backend development, and other programming areas",
-    "provider": {
-      "@type": "Organization",
-      "name": "AI Tutor",
-      "url": "https://ai-tutor.example.com"
-    },
-    "educationalLevel": "beginner to advanced",
-    "assesses": [
-      "Frontend Development Skills",
-      "Backend Development Skills",
-      "Programming Fundamentals",
-      "Web Development Knowledge"
-    ],
-    "timeRequired": "PT15M",
-    "interactivityType": "mixed",
-    "learningResourceType": "assessment"
-  };
-}
+// Structured data for SEO; the payload is fully static, so serialize it
+// once at module load and reuse the same JSON string for every request
+const STRUCTURED_DATA_JSON = JSON.stringify({
+  "@context": "https://schema.org",
+  "@type": "Quiz",
+  "name": "Programming Skill Assessments",
+  "description": "Comprehensive skill assessments covering frontend development, backend development, and other programming areas",
+  "provider": {
+    "@type": "Organization",
+    "name": "AI Tutor",
+    "url": "https://ai-tutor.example.com"
+  },
+  "educationalLevel": "beginner to advanced",
+  "assesses": [
+    "Frontend Development Skills",
+    "Backend Development Skills",
+    "Programming Fundamentals",
+    "Web Development Knowledge"
+  ],
+  "timeRequired": "PT15M",
+  "interactivityType": "mixed",
+  "learningResourceType": "assessment"
+});
 
 export default async function AssessmentListPage() {
-  const structuredData = generateStructuredData();
-
   return (
     <>
       {/* Structured Data for SEO */}
       <script
         type="application/ld+json"
-        dangerouslySetInnerHTML={{ __html: JSON.stringify(structuredData) }}
+        dangerouslySetInnerHTML={{ __html: STRUCTURED_DATA_JSON }}
       />
       
       <div className="container mx-auto p-4 max-w-6xl">
@@ -49,47 +49,44 @@ export const metadata: Metadata = {
   }
 };
 
-// Generate structured data for SEO
-function generateStructuredData() {
-  return {
-    "@context": "https://schema.org",
-    "@type": "Course",
-    "name": "AI Tutor Learning Tracks",
-    "description": "Comprehensive programming courses covering Frontend Development, Backend Development, Mobile Development, UX/UI Design, DevOps, and Data Science",
-    "provider": {
-      "@type": "Organization",
-      "name": "AI Tutor",
-      "url": "https://ai-tutor.example.com"
-    },
-    "courseMode": "online",
-    "educationalLevel": "beginner to advanced",
-    "teaches": [
-      "Frontend Development",
-      "Backend Development", 
-      "Mobile Development",
-      "UX/UI Design",
-      "DevOps & Cloud",
-      "Data Science"
-    ],
-    "programmingLanguage": [
-      "JavaScript",
-      "TypeScript", 
-      "Python",
-      "React",
-      "Node.js"
-    ]
-  };
-}
+// Structured data for SEO; the payload is fully static, so serialize it
+// once at module load and reuse the same JSON string for every request
+const STRUCTURED_DATA_JSON = JSON.stringify({
+  "@context": "https://schema.org",
+  "@type": "Course",
+  "name": "AI Tutor Learning Tracks",
+  "description": "Comprehensive programming courses covering Frontend Development, Backend Development, Mobile Development, UX/UI Design, DevOps, and Data Science",
+  "provider": {
+    "@type": "Organization",
+    "name": "AI Tutor",
+    "url": "https://ai-tutor.example.com"
+  },
+  "courseMode": "online",
+  "educationalLevel": "beginner to advanced",
+  "teaches": [
+    "Frontend Development",
+    "Backend Development", 
+    "Mobile Development",
+    "UX/UI Design",
+    "DevOps & Cloud",
+    "Data Science"
+  ],
+  "programmingLanguage": [
+    "JavaScript",
+    "TypeScript", 
+    "Python",
+    "React",
+    "Node.js"
+  ]
+});
 
 export default async function ExplorePage() {
-  const structuredData = generateStructuredData();
-
   return (
     <>
       {/* Structured Data for SEO */}
       <script
         type="application/ld+json"
-        dangerouslySetInnerHTML={{ __html: JSON.stringify(structuredData) }}
+        dangerouslySetInnerHTML={{ __html: STRUCTURED_DATA_JSON }}
       />
       
       <div className="container mx-auto p-4 max-w-6xl">
@@ -42,35 +42,32 @@ export const metadata: Metadata = {
   }
 };
 
-// Generate structured data for SEO
-function generateStructuredData() {
-  return {
-    "@context": "https://schema.org",
-    "@type": "WebPage",
-    "name": "Learning Progress Dashboard",
-    "description": "Personal learning dashboard showing course progress, achievements, and learning analytics",
-    "mainEntity": {
-      "@type": "LearningResource",
-      "name": "Progress Tracking",
-      "description": "Comprehensive tracking of learning progress across multiple programming courses",
-      "teaches": [
-        "Progress monitoring",
-        "Achievement tracking", 
-        "Learning analytics"
-      ]
-    }
-  };
-}
+// Structured data for SEO; the payload is fully static, so serialize it
+// once at module load and reuse the same JSON string for every request
+const STRUCTURED_DATA_JSON = JSON.stringify({
+  "@context": "https://schema.org",
+  "@type": "WebPage",
+  "name": "Learning Progress Dashboard",
+  "description": "Personal learning dashboard showing course progress, achievements, and learning analytics",
+  "mainEntity": {
+    "@type": "LearningResource",
+    "name": "Progress Tracking",
+    "description": "Comprehensive tracking of learning progress across multiple programming courses",
+    "teaches": [
+      "Progress monitoring",
+      "Achievement tracking", 
+      "Learning analytics"
+    ]
+  }
+});
 
 export default async function ProgressPage() {
-  const structuredData = generateStructuredData();
-
   return (
     <>
       {/* Structured Data for SEO */}
       <script
         type="application/ld+json"
-        dangerouslySetInnerHTML={{ __html: JSON.stringify(structuredData) }}
+        dangerouslySetInnerHTML={{ __html: STRUCTURED_DATA_JSON }}
       />
       
       <div className="container mx-auto p-4 max-w-6xl">
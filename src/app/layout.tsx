@@ -4,6 +4,7 @@ import type { Metadata, Viewport } from "next";
 import { ThemeProvider } from "@/components/theme-provider";
 import { AccessibilityProvider, SkipToMainContent } from "@/components/shared/AccessibilityProvider";
 import "./globals.css";
+import { appConfig } from "@/utils/config";
 
 // const inter = Inter({ 
 //   subsets: ["latin"],
@@ -16,7 +17,7 @@ export const metadata: Metadata = {
   description: "Advanced AI-powered tutoring platform with personalized learning paths, real-time assistance, and comprehensive progress tracking.",
   keywords: "AI tutor, learning, education, personalized learning, online courses",
   robots: "index, follow",
-  metadataBase: new URL(process.env.NEXT_PUBLIC_BASE_URL || 'http://localhost:3000'),
+  metadataBase: new URL(appConfig.baseUrl),
 };
 
 export const viewport: Viewport = {
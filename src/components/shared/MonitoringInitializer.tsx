@@ -11,10 +11,19 @@ export function MonitoringInitializer() {
   useEffect(() => {
     // All monitoring services are auto-initialized when their instances are created
     // No need to call init() as it's private and already called in constructors
-    
-    // Initialize service worker for offline support
-    initializeServiceWorker().catch(console.error);
-    
+
+    // Service worker registration is not needed for first paint or
+    // interactivity, so push it off the startup critical path: run it when
+    // the main thread goes idle instead of competing with hydration
+    const startServiceWorker = () => {
+      initializeServiceWorker().catch(console.error);
+    };
+    if ('requestIdleCallback' in window) {
+      window.requestIdleCallback(startServiceWorker, { timeout: 5000 });
+    } else {
+      setTimeout(startServiceWorker, 1);
+    }
+
     // Track page load completion
     if (typeof window !== 'undefined') {
       window.addEventListener('load', () => {
@@ -64,21 +64,26 @@ describe('Server Component Data Fetching - Core Functionality', () => {
       const tracks = await getLearningTracks();
       const trackTitles = tracks.map(track => track.title);
       
-      expect(trackTitles).toContain('Frontend Development');
-      expect(trackTitles).toContain('UX/UI Design');
-      expect(trackTitles).toContain('Backend Development');
-      expect(trackTitles).toContain('Mobile Development');
-      expect(trackTitles).toContain('DevOps & Cloud');
-      expect(trackTitles).toContain('Data Science');
+      // The mock catalog is deterministic, so assert the full title list in
+      // one structured equality instead of six separate membership scans —
+      // stricter (catches unexpected extras) and a single comparison
+      expect(trackTitles).toEqual([
+        'Frontend Development',
+        'UX/UI Design',
+        'Backend Development',
+        'Mobile Development',
+        'DevOps & Cloud',
+        'Data Science',
+      ]);
     });
 
     it('should have proper difficulty levels', async () => {
       const tracks = await getLearningTracks();
-      const difficulties = tracks.map(track => track.difficulty);
-      
-      expect(difficulties).toContain('Beginner');
-      expect(difficulties).toContain('Intermediate');
-      expect(difficulties).toContain('Advanced');
+      const difficulties = new Set(tracks.map(track => track.difficulty));
+
+      // One pass over the tracks instead of three membership scans of the
+      // materialized difficulty array
+      expect(difficulties).toEqual(new Set(['Beginner', 'Intermediate', 'Advanced']));
     });
   });
 
@@ -239,10 +244,14 @@ describe('Server Component Data Fetching - Core Functionality', () => {
 
   describe('Data Structure Validation', () => {
     it('should maintain consistent data types across all functions', async () => {
-      const tracks = await getLearningTracks();
-      const progress = await getUserProgress('test-user');
-      const assessments = await getSkillAssessments();
-      const preferences = await getLearningPreferences('test-user');
+      // The four queries are independent, so run them concurrently instead
+      // of serializing their simulated network delays
+      const [tracks, progress, assessments, preferences] = await Promise.all([
+        getLearningTracks(),
+        getUserProgress('test-user'),
+        getSkillAssessments(),
+        getLearningPreferences('test-user'),
+      ]);
       
       // All should return defined values
       expect(tracks).toBeDefined();
@@ -7,34 +7,46 @@ import type { MessageActionState, TabType, SendMessageRequest, SendMessageRespon
 
 const VALID_TAB_TYPES: TabType[] = ['home', 'progress', 'review', 'explore'];
 
+// Error states are immutable, so build them once instead of per invocation
+const EMPTY_MESSAGE_STATE: MessageActionState = Object.freeze({
+  success: false,
+  error: 'Message cannot be empty',
+  isLoading: false,
+  message: null,
+});
+
+const INVALID_TAB_STATE: MessageActionState = Object.freeze({
+  success: false,
+  error: 'Invalid tab type',
+  isLoading: false,
+  message: null,
+});
+
+const SEND_FAILED_STATE: MessageActionState = Object.freeze({
+  success: false,
+  error: 'Failed to send message. Please try again.',
+  isLoading: false,
+  message: null,
+});
+
 export async function sendMessageAction(
   prevState: MessageActionState | null,
   formData: FormData
 ): Promise<MessageActionState> {
-  try {
-    // Extract and validate form data
-    const message = formData.get('message')?.toString()?.trim();
-    const tabType = formData.get('tabType')?.toString() as TabType;
+  // Extract and validate form data synchronously, before any async work:
+  // malformed input is rejected without entering the try/await machinery
+  const message = formData.get('message')?.toString()?.trim();
+  const tabType = formData.get('tabType')?.toString() as TabType;
 
-    // Input validation
-    if (!message) {
-      return {
-        success: false,
-        error: 'Message cannot be empty',
-        isLoading: false,
-        message: null,
-      };
-    }
+  if (!message) {
+    return EMPTY_MESSAGE_STATE;
+  }
 
-    if (!tabType || !VALID_TAB_TYPES.includes(tabType)) {
-      return {
-        success: false,
-        error: 'Invalid tab type',
-        isLoading: false,
-        message: null,
-      };
-    }
+  if (!tabType || !VALID_TAB_TYPES.includes(tabType)) {
+    return INVALID_TAB_STATE;
+  }
 
+  try {
     // Prepare request payload
     const requestData: SendMessageRequest = {
       message,
@@ -63,11 +75,6 @@ export async function sendMessageAction(
   } catch (error) {
     console.error('Failed to send message:', error);
     
-    return {
-      success: false,
-      error: 'Failed to send message. Please try again.',
-      isLoading: false,
-      message: null,
-    };
+    return SEND_FAILED_STATE;
   }
 }
\ No newline at end of file
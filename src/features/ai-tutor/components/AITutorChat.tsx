@@ -23,6 +23,8 @@ import { Tabs, TabsContent, TabsList, TabsTrigger } from '@/components/ui/tabs';
 import { ScrollArea } from '@/components/ui/scroll-area';
 import { Card, CardContent } from '@/components/ui/card';
 import { Badge } from '@/components/ui/badge';
+import { formatMessageTime } from '../utils/timeFormat';
+import { matchChatIntent } from '../utils/intent';
 
 // Import previously created components - using direct imports to avoid circular dependencies
 import { TrackExplorationComponent } from './learning/TrackExplorationComponent';
@@ -81,12 +83,14 @@ const getInitialMessages = (tab: TabType): Message[] => {
 
 export const AITutorChat: React.FC = () => {
   // Separate message states for each tab
-  const [tabMessages, setTabMessages] = useState<Record<TabType, Message[]>>({
+  // Lazy initializer so the initial message graph (including embedded
+  // interactive components) is built once per mount, not on every render
+  const [tabMessages, setTabMessages] = useState<Record<TabType, Message[]>>(() => ({
     home: getInitialMessages('home'),
     progress: getInitialMessages('progress'),
     review: getInitialMessages('review'),
     explore: getInitialMessages('explore'),
-  });
+  }));
   
   const [inputValue, setInputValue] = useState('');
   const [activeTab, setActiveTab] = useState<TabType>('home');
@@ -186,31 +190,33 @@ export const AITutorChat: React.FC = () => {
       throw new Error('Network connection failed. Please try again.');
     }
     
-    // Generate AI response based on input
-    if (input.toLowerCase().includes('progress')) {
-      throw new Error('Use progress button instead');
-    } else if (input.toLowerCase().includes('help')) {
-      return {
-        id: (Date.now() + 1).toString(),
-        type: 'ai',
-        content: "I'm here to help! What specific topic would you like assistance with?",
-        timestamp: new Date()
-      };
-    } else if (input.toLowerCase().includes('review')) {
-      return {
-        id: (Date.now() + 1).toString(),
-        type: 'ai',
-        content: "Let's start a review session:",
-        timestamp: new Date(),
-        component: <FlashcardReviewComponent onComplete={handleReviewComplete} />
-      };
-    } else {
-      return {
-        id: (Date.now() + 1).toString(),
-        type: 'ai',
-        content: "I understand you're interested in that topic. Let me help you with personalized guidance based on your learning path.",
-        timestamp: new Date()
-      };
+    // Generate AI response based on the matched intent; the keyword table
+    // lowercases the input once instead of per branch
+    switch (matchChatIntent(input)) {
+      case 'progress':
+        throw new Error('Use progress button instead');
+      case 'help':
+        return {
+          id: (Date.now() + 1).toString(),
+          type: 'ai',
+          content: "I'm here to help! What specific topic would you like assistance with?",
+          timestamp: new Date()
+        };
+      case 'review':
+        return {
+          id: (Date.now() + 1).toString(),
+          type: 'ai',
+          content: "Let's start a review session:",
+          timestamp: new Date(),
+          component: <FlashcardReviewComponent onComplete={handleReviewComplete} />
+        };
+      default:
+        return {
+          id: (Date.now() + 1).toString(),
+          type: 'ai',
+          content: "I understand you're interested in that topic. Let me help you with personalized guidance based on your learning path.",
+          timestamp: new Date()
+        };
     }
   };
 
@@ -425,7 +431,7 @@ export const AITutorChat: React.FC = () => {
                             </motion.div>
                           )}
                           <span className={`text-xs ${message.type === 'user' ? 'text-right text-white/70' : 'text-left text-gray-400'}`}>
-                            {message.timestamp.toLocaleTimeString([], { hour: '2-digit', minute: '2-digit' })}
+                            {formatMessageTime(message.timestamp)}
                           </span>
                         </div>
                       </div>
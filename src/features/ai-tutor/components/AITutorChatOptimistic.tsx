@@ -22,6 +22,7 @@ import { OptimisticMessageList } from './chat/OptimisticMessageList';
 import { OptimisticMessageInput } from './chat/OptimisticMessageInput';
 import { useOptimisticRetry } from '../hooks/useOptimisticRetry';
 import { useBatchOptimistic } from '../hooks/useBatchOptimistic';
+import { matchChatIntent } from '../utils/intent';
 
 // Import types
 import type { OptimisticMessage, TabType, QuickAction } from './chat/types';
@@ -85,12 +86,14 @@ const getInitialMessages = (tab: TabType): OptimisticMessage[] => {
  */
 export const AITutorChatOptimistic: React.FC = () => {
   // Separate message states for each tab using optimistic hook
-  const [tabMessages, setTabMessages] = useState<Record<TabType, OptimisticMessage[]>>({
+  // Lazy initializer so the initial message graph (including embedded
+  // interactive components) is built once per mount, not on every render
+  const [tabMessages, setTabMessages] = useState<Record<TabType, OptimisticMessage[]>>(() => ({
     home: getInitialMessages('home'),
     progress: getInitialMessages('progress'),
     review: getInitialMessages('review'),
     explore: getInitialMessages('explore'),
-  });
+  }));
   
   const [activeTab, setActiveTab] = useState<TabType>('home');
   const [isTyping, setIsTyping] = useState(false);
@@ -142,34 +145,36 @@ export const AITutorChatOptimistic: React.FC = () => {
       throw new Error('Network connection failed. Please try again.');
     }
     
-    // Generate AI response based on input
-    if (input.toLowerCase().includes('progress')) {
-      throw new Error('Use progress button instead');
-    } else if (input.toLowerCase().includes('help')) {
-      return {
-        id: `ai-${Date.now()}`,
-        type: 'ai',
-        content: "I'm here to help! What specific topic would you like assistance with?",
-        timestamp: new Date(),
-        status: 'sent',
-      };
-    } else if (input.toLowerCase().includes('review')) {
-      return {
-        id: `ai-${Date.now()}`,
-        type: 'ai',
-        content: "Let's start a review session:",
-        timestamp: new Date(),
-        status: 'sent',
-        component: <FlashcardReviewComponent onComplete={handleReviewComplete} />
-      };
-    } else {
-      return {
-        id: `ai-${Date.now()}`,
-        type: 'ai',
-        content: "I understand you're interested in that topic. Let me help you with personalized guidance based on your learning path.",
-        timestamp: new Date(),
-        status: 'sent',
-      };
+    // Generate AI response based on the matched intent; the keyword table
+    // lowercases the input once instead of per branch
+    switch (matchChatIntent(input)) {
+      case 'progress':
+        throw new Error('Use progress button instead');
+      case 'help':
+        return {
+          id: `ai-${Date.now()}`,
+          type: 'ai',
+          content: "I'm here to help! What specific topic would you like assistance with?",
+          timestamp: new Date(),
+          status: 'sent',
+        };
+      case 'review':
+        return {
+          id: `ai-${Date.now()}`,
+          type: 'ai',
+          content: "Let's start a review session:",
+          timestamp: new Date(),
+          status: 'sent',
+          component: <FlashcardReviewComponent onComplete={handleReviewComplete} />
+        };
+      default:
+        return {
+          id: `ai-${Date.now()}`,
+          type: 'ai',
+          content: "I understand you're interested in that topic. Let me help you with personalized guidance based on your learning path.",
+          timestamp: new Date(),
+          status: 'sent',
+        };
     }
   }, [handleReviewComplete]);
 
@@ -21,6 +21,7 @@ import { Tabs, TabsContent, TabsList, TabsTrigger } from '@/components/ui/tabs';
 import { ScrollArea } from '@/components/ui/scroll-area';
 import { Card, CardContent } from '@/components/ui/card';
 import { Badge } from '@/components/ui/badge';
+import { formatMessageTime } from '../utils/timeFormat';
 
 // Import chat components
 import { MessageInputWithActions } from './chat/MessageInputWithActions';
@@ -82,12 +83,14 @@ const getInitialMessages = (tab: TabType): ChatMessage[] => {
 
 export const AITutorChatWithActions: React.FC = () => {
   // Separate message states for each tab
-  const [tabMessages, setTabMessages] = useState<Record<TabType, ChatMessage[]>>({
+  // Lazy initializer so the initial message graph (including embedded
+  // interactive components) is built once per mount, not on every render
+  const [tabMessages, setTabMessages] = useState<Record<TabType, ChatMessage[]>>(() => ({
     home: getInitialMessages('home'),
     progress: getInitialMessages('progress'),
     review: getInitialMessages('review'),
     explore: getInitialMessages('explore'),
-  });
+  }));
   
   const [activeTab, setActiveTab] = useState<TabType>('home');
   const messagesEndRef = useRef<HTMLDivElement>(null);
@@ -341,7 +344,7 @@ export const AITutorChatWithActions: React.FC = () => {
                             </motion.div>
                           )}
                           <span className={`text-xs ${message.type === 'user' ? 'text-right text-white/70' : 'text-left text-gray-400'}`}>
-                            {message.timestamp.toLocaleTimeString([], { hour: '2-digit', minute: '2-digit' })}
+                            {formatMessageTime(message.timestamp)}
                           </span>
                         </div>
                       </div>
@@ -21,6 +21,7 @@ import { Input } from '@/components/ui/input';
 import { Avatar, AvatarFallback } from '@/components/ui/avatar';
 import { Tabs, TabsContent, TabsList, TabsTrigger } from '@/components/ui/tabs';
 import { ScrollArea } from '@/components/ui/scroll-area';
+import { formatMessageTime } from '../utils/timeFormat';
 import { Card, CardContent } from '@/components/ui/card';
 import { Badge } from '@/components/ui/badge';
 
@@ -29,10 +30,18 @@ import { useMessageDisplay, useMessageInput, useTabManager } from '../stores/cha
 import { useChatActions } from '../stores/chatStore';
 import type { TabType, OptimisticMessage } from '../types';
 
-// Import previously created components for interactive content
-import { InteractiveLessonComponent } from './learning/InteractiveLessonComponent';
+// Import previously created components for interactive content.
+// The lesson and flashcard surfaces only appear after a user action, so
+// load them on demand instead of shipping them in the initial chat bundle.
+import dynamic from 'next/dynamic';
 import { ProgressDashboardComponent } from './dashboard/ProgressDashboardComponent';
-import { FlashcardReviewComponent } from './learning/FlashcardReviewComponent';
+
+const InteractiveLessonComponent = dynamic(() =>
+  import('./learning/InteractiveLessonComponent').then(m => m.InteractiveLessonComponent)
+);
+const FlashcardReviewComponent = dynamic(() =>
+  import('./learning/FlashcardReviewComponent').then(m => m.FlashcardReviewComponent)
+);
 
 /**
  * Enhanced Message Display Component
@@ -123,7 +132,7 @@ const MessageListWithStore: React.FC<{ tab: TabType }> = ({ tab }) => {
                   )}
                   
                   <span className={`text-xs ${message.type === 'user' ? 'text-right text-white/70' : 'text-left text-gray-400'}`}>
-                    {new Date(message.timestamp).toLocaleTimeString([], { hour: '2-digit', minute: '2-digit' })}
+                    {formatMessageTime(new Date(message.timestamp))}
                   </span>
                 </div>
               </div>
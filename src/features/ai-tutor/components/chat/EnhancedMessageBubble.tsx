@@ -15,6 +15,7 @@ import { Button } from '@/components/ui/button';
 import { Avatar, AvatarFallback } from '@/components/ui/avatar';
 import { Card, CardContent } from '@/components/ui/card';
 import { cn } from '@/lib/utils';
+import { formatMessageTime } from '../../utils/timeFormat';
 import type { MessageBubbleProps } from './types';
 
 /**
@@ -25,8 +26,12 @@ import type { MessageBubbleProps } from './types';
  * - Retry functionality for failed messages
  * - Accessibility support with proper ARIA labels
  * - Smooth animations for state transitions
+ *
+ * Memoized so appending a new message to the list doesn't re-render every
+ * existing bubble: message objects are replaced immutably on change, so a
+ * shallow prop check is enough to skip untouched messages.
  */
-export const EnhancedMessageBubble: React.FC<MessageBubbleProps> = ({
+export const EnhancedMessageBubble: React.FC<MessageBubbleProps> = React.memo(({
   message,
   onRetry,
   className,
@@ -195,10 +200,7 @@ export const EnhancedMessageBubble: React.FC<MessageBubbleProps> = ({
             <span className={cn(
               isUser ? 'text-blue-300' : 'text-gray-400'
             )}>
-              {message.timestamp.toLocaleTimeString([], { 
-                hour: '2-digit', 
-                minute: '2-digit' 
-              })}
+              {formatMessageTime(message.timestamp)}
             </span>
             
             {/* Status indicators */}
@@ -239,6 +241,8 @@ export const EnhancedMessageBubble: React.FC<MessageBubbleProps> = ({
       </div>
     </motion.div>
   );
-};
+});
+
+EnhancedMessageBubble.displayName = 'EnhancedMessageBubble';
 
 export default EnhancedMessageBubble;
\ No newline at end of file
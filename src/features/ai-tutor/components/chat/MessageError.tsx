@@ -38,11 +38,12 @@ export function MessageError({
   };
 
   const getErrorType = (errorMessage: string) => {
-    if (errorMessage.toLowerCase().includes('network') || 
-        errorMessage.toLowerCase().includes('connection')) {
+    // Lowercase once and reuse it across the keyword checks
+    const lowered = errorMessage.toLowerCase();
+    if (lowered.includes('network') || lowered.includes('connection')) {
       return 'network';
     }
-    if (errorMessage.toLowerCase().includes('timeout')) {
+    if (lowered.includes('timeout')) {
       return 'timeout';
     }
     return 'general';
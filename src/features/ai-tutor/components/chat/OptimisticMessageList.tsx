@@ -16,6 +16,7 @@ import { Avatar, AvatarFallback } from '@/components/ui/avatar';
 import { Card, CardContent } from '@/components/ui/card';
 import { ScrollArea } from '@/components/ui/scroll-area';
 import { cn } from '@/lib/utils';
+import { formatMessageTime } from '../../utils/timeFormat';
 import type { OptimisticMessage, OptimisticMessageListProps } from './types';
 
 // Optimistic reducer for useOptimistic
@@ -169,10 +170,7 @@ const MessageBubble: React.FC<{
             <span className={cn(
               isUser ? 'text-blue-300' : 'text-gray-400'
             )}>
-              {message.timestamp.toLocaleTimeString([], { 
-                hour: '2-digit', 
-                minute: '2-digit' 
-              })}
+              {formatMessageTime(message.timestamp)}
             </span>
             
             {isPending && (
@@ -43,12 +43,13 @@ const mockUseOptimistic = useOptimistic as unknown as ReturnType<typeof vi.fn>;
 describe('OptimisticMessageInput', () => {
   beforeEach(() => {
     vi.clearAllMocks();
+    // Default useOptimistic stub (empty list, throwaway dispatcher); tests
+    // that need to observe the dispatcher install their own return value
+    mockUseOptimistic.mockReturnValue([[], vi.fn()]);
   });
 
   describe('Basic Functionality', () => {
     it('should render input field and send button', () => {
-      mockUseOptimistic.mockReturnValue([[], vi.fn()]);
-
       render(
         <OptimisticMessageInput
           onSendMessage={vi.fn()}
@@ -62,8 +63,6 @@ describe('OptimisticMessageInput', () => {
 
     it('should accept user input', async () => {
       const user = userEvent.setup();
-      mockUseOptimistic.mockReturnValue([[], vi.fn()]);
-
       render(
         <OptimisticMessageInput
           onSendMessage={vi.fn()}
@@ -78,8 +77,6 @@ describe('OptimisticMessageInput', () => {
     });
 
     it('should have correct placeholder text', () => {
-      mockUseOptimistic.mockReturnValue([[], vi.fn()]);
-
       render(
         <OptimisticMessageInput
           onSendMessage={vi.fn()}
@@ -196,8 +193,6 @@ describe('OptimisticMessageInput', () => {
 
   describe('Form Validation', () => {
     it('should disable send button when input is empty', () => {
-      mockUseOptimistic.mockReturnValue([[], vi.fn()]);
-
       render(
         <OptimisticMessageInput
           onSendMessage={vi.fn()}
@@ -211,8 +206,6 @@ describe('OptimisticMessageInput', () => {
 
     it('should enable send button when input has content', async () => {
       const user = userEvent.setup();
-      mockUseOptimistic.mockReturnValue([[], vi.fn()]);
-
       render(
         <OptimisticMessageInput
           onSendMessage={vi.fn()}
@@ -258,8 +251,6 @@ describe('OptimisticMessageInput', () => {
 
     it('should enforce maximum message length', async () => {
       const user = userEvent.setup();
-      mockUseOptimistic.mockReturnValue([[], vi.fn()]);
-
       render(
         <OptimisticMessageInput
           onSendMessage={vi.fn()}
@@ -329,8 +320,6 @@ describe('OptimisticMessageInput', () => {
 
     it('should support multiline input with Shift+Enter', async () => {
       const user = userEvent.setup();
-      mockUseOptimistic.mockReturnValue([[], vi.fn()]);
-
       render(
         <OptimisticMessageInput
           onSendMessage={vi.fn()}
@@ -350,7 +339,11 @@ describe('OptimisticMessageInput', () => {
   describe('Error Handling', () => {
     it('should show error message when send fails', async () => {
       const user = userEvent.setup();
-      const mockOnSendMessage = vi.fn().mockRejectedValue(new Error('Network error'));
+      // These tests only assert the rendered error UI and never inspect the
+      // stub's calls, so a plain rejecting function is all the machinery needed
+      const mockOnSendMessage = async () => {
+        throw new Error('Network error');
+      };
       const mockAddOptimistic = vi.fn();
       
       mockUseOptimistic.mockReturnValue([[], mockAddOptimistic]);
@@ -530,8 +523,6 @@ describe('OptimisticMessageInput', () => {
 
   describe('Accessibility', () => {
     it('should have proper ARIA labels', () => {
-      mockUseOptimistic.mockReturnValue([[], vi.fn()]);
-
       render(
         <OptimisticMessageInput
           onSendMessage={vi.fn()}
@@ -548,7 +539,11 @@ describe('OptimisticMessageInput', () => {
 
     it('should announce error messages to screen readers', async () => {
       const user = userEvent.setup();
-      const mockOnSendMessage = vi.fn().mockRejectedValue(new Error('Network error'));
+      // These tests only assert the rendered error UI and never inspect the
+      // stub's calls, so a plain rejecting function is all the machinery needed
+      const mockOnSendMessage = async () => {
+        throw new Error('Network error');
+      };
       const mockAddOptimistic = vi.fn();
       
       mockUseOptimistic.mockReturnValue([[], mockAddOptimistic]);
@@ -575,8 +570,6 @@ describe('OptimisticMessageInput', () => {
 
     it('should support keyboard navigation', async () => {
       const user = userEvent.setup();
-      mockUseOptimistic.mockReturnValue([[], vi.fn()]);
-
       render(
         <OptimisticMessageInput
           onSendMessage={vi.fn()}
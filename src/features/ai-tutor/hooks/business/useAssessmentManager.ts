@@ -448,55 +448,74 @@ function checkAnswerCorrectness(question: AssessmentQuestion, answer: string | s
   return answer.toLowerCase().trim() === question.correctAnswer.toLowerCase().trim();
 }
 
+// Ordered keyword → topic lookup table, built once at module scope.
+// First match wins, preserving the precedence of the old if-chain.
+const TOPIC_KEYWORDS: ReadonlyArray<readonly [string, string]> = [
+  ['react', 'React'],
+  ['javascript', 'JavaScript'],
+  ['js', 'JavaScript'],
+  ['typescript', 'TypeScript'],
+  ['ts', 'TypeScript'],
+  ['css', 'CSS'],
+  ['html', 'HTML'],
+  ['api', 'APIs'],
+  ['state', 'State Management'],
+  ['component', 'Components'],
+  ['hook', 'Hooks'],
+];
+
 /**
  * Extract topic from question for recommendations
  */
 function extractTopicFromQuestion(question: AssessmentQuestion): string {
   // Simple topic extraction based on question content
   const content = question.question.toLowerCase();
-  
-  if (content.includes('react')) return 'React';
-  if (content.includes('javascript') || content.includes('js')) return 'JavaScript';
-  if (content.includes('typescript') || content.includes('ts')) return 'TypeScript';
-  if (content.includes('css')) return 'CSS';
-  if (content.includes('html')) return 'HTML';
-  if (content.includes('api')) return 'APIs';
-  if (content.includes('state')) return 'State Management';
-  if (content.includes('component')) return 'Components';
-  if (content.includes('hook')) return 'Hooks';
-  
+
+  for (const [keyword, topic] of TOPIC_KEYWORDS) {
+    if (content.includes(keyword)) return topic;
+  }
+
   return 'General Programming';
 }
 
 /**
  * Generate mock questions for testing
+ *
+ * The question set is fixed, so the question objects are built and frozen
+ * once at module scope; every assessment start gets a fresh array of the
+ * shared frozen questions, so callers can reorder or slice their copy but
+ * cannot mutate a question out from under other assessments.
  */
+const MOCK_QUESTIONS: readonly AssessmentQuestion[] = [
+  {
+    id: 'q1',
+    question: 'What is React?',
+    type: 'multiple-choice',
+    options: ['Library', 'Framework', 'Language', 'Tool'],
+    correctAnswer: 'Library',
+    explanation: 'React is a JavaScript library for building user interfaces',
+    points: 10
+  },
+  {
+    id: 'q2',
+    question: 'What does JSX stand for?',
+    type: 'multiple-choice',
+    options: ['JavaScript XML', 'Java Syntax Extension', 'JSON XML', 'JavaScript Extension'],
+    correctAnswer: 'JavaScript XML',
+    explanation: 'JSX stands for JavaScript XML',
+    points: 10
+  },
+  {
+    id: 'q3',
+    question: 'Explain the useState hook',
+    type: 'short-answer',
+    correctAnswer: 'useState is a Hook that lets you add React state to function components',
+    points: 15
+  }
+];
+MOCK_QUESTIONS.forEach(question => Object.freeze(question));
+Object.freeze(MOCK_QUESTIONS);
+
 function generateMockQuestions(): AssessmentQuestion[] {
-  return [
-    {
-      id: 'q1',
-      question: 'What is React?',
-      type: 'multiple-choice',
-      options: ['Library', 'Framework', 'Language', 'Tool'],
-      correctAnswer: 'Library',
-      explanation: 'React is a JavaScript library for building user interfaces',
-      points: 10
-    },
-    {
-      id: 'q2',
-      question: 'What does JSX stand for?',
-      type: 'multiple-choice',
-      options: ['JavaScript XML', 'Java Syntax Extension', 'JSON XML', 'JavaScript Extension'],
-      correctAnswer: 'JavaScript XML',
-      explanation: 'JSX stands for JavaScript XML',
-      points: 10
-    },
-    {
-      id: 'q3',
-      question: 'Explain the useState hook',
-      type: 'short-answer',
-      correctAnswer: 'useState is a Hook that lets you add React state to function components',
-      points: 15
-    }
-  ];
+  return [...MOCK_QUESTIONS];
 }
\ No newline at end of file
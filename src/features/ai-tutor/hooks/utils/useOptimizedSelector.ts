@@ -5,6 +5,11 @@
 import { useRef, useCallback, useEffect } from 'react';
 import { useShallow } from 'zustand/react/shallow';
 
+// Resolved once at module scope; the dev-only instrumentation effects run on
+// every render of their host components, so they should not re-read the
+// environment each time
+const IS_DEV = process.env.NODE_ENV === 'development';
+
 /**
  * High-performance selector hook with custom equality comparison
  * 
@@ -156,7 +161,7 @@ export const usePerformanceMonitor = (
   const lastRenderTime = useRef(performance.now());
   
   useEffect(() => {
-    if (process.env.NODE_ENV === 'development') {
+    if (IS_DEV) {
       renderCount.current++;
       const currentTime = performance.now();
       const timeDiff = currentTime - lastRenderTime.current;
@@ -275,7 +280,7 @@ export const useTrackChanges = <T>(
   const prevValue = useRef<T | undefined>(undefined);
   
   useEffect(() => {
-    if (process.env.NODE_ENV === 'development' && prevValue.current !== undefined) {
+    if (IS_DEV && prevValue.current !== undefined) {
       if (prevValue.current !== value) {
         console.log(`[Change Tracker] ${name}:`, {
           from: prevValue.current,
@@ -211,7 +211,9 @@ export const useStoreIntegration = (): StoreIntegrationReturn => {
       const trackProgress = learningState.progress[learningState.currentTrack];
       if (trackProgress) {
         // This would update chat context with learning progress
-        console.log('Syncing learning progress to chat:', trackProgress);
+        if (process.env.NODE_ENV === 'development') {
+          console.log('Syncing learning progress to chat:', trackProgress);
+        }
       }
     }
 
@@ -223,7 +225,9 @@ export const useStoreIntegration = (): StoreIntegrationReturn => {
       // Check if this achievement is new (within last 5 minutes)
       const achievementAge = Date.now() - new Date(latestAchievement.earnedAt).getTime();
       if (achievementAge < 5 * 60 * 1000) {
-        console.log('New achievement detected for chat notification:', latestAchievement);
+        if (process.env.NODE_ENV === 'development') {
+          console.log('New achievement detected for chat notification:', latestAchievement);
+        }
       }
     }
   }, [learningState]);
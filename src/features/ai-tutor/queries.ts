@@ -1,10 +1,12 @@
 // Server-side data fetching layer for AI Tutor learning components
+import { revalidateTag } from 'next/cache';
+import { appConfig } from '@/utils/config';
 import type { LearningTrack } from './components/learning/TrackExplorationComponent';
 import type { SkillAssessment } from './components/learning/SkillAssessmentComponent';
 
 // Mock API base URL - this project uses isolated frontend with mocked data
 // In production, this would be replaced with Next.js API routes
-const API_BASE = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:3000';
+const API_BASE = appConfig.apiBaseUrl;
 
 // Cache tags for Next.js revalidation
 export const CACHE_TAGS = {
@@ -145,70 +147,79 @@ export async function getLearningPreferences(userId: string): Promise<LearningPr
   }
 }
 
-// Mock data functions for development and fallbacks
+// Mock data functions for development and fallbacks.
+// The track and assessment catalogs are static, so the entries are built
+// and frozen once at module scope; the accessors hand each caller a fresh
+// array of the shared frozen entries, so a caller mutating its copy cannot
+// corrupt the catalog for everyone else.
+const MOCK_LEARNING_TRACKS: readonly LearningTrack[] = [
+  {
+    id: '1',
+    title: 'Frontend Development',
+    description: 'Master React, TypeScript, and modern web development',
+    icon: 'Code',
+    progress: 0,
+    difficulty: 'Beginner',
+    duration: '12 weeks',
+    skills: ['React', 'TypeScript', 'CSS', 'JavaScript', 'Next.js', 'Tailwind CSS']
+  },
+  {
+    id: '2',
+    title: 'UX/UI Design',
+    description: 'Learn user experience design and interface creation',
+    icon: 'Palette',
+    progress: 0,
+    difficulty: 'Beginner',
+    duration: '10 weeks',
+    skills: ['Figma', 'Design Systems', 'User Research', 'Prototyping', 'Wireframing']
+  },
+  {
+    id: '3',
+    title: 'Backend Development',
+    description: 'Build scalable server-side applications',
+    icon: 'Database',
+    progress: 0,
+    difficulty: 'Intermediate',
+    duration: '14 weeks',
+    skills: ['Node.js', 'APIs', 'Databases', 'Authentication', 'Docker', 'AWS']
+  },
+  {
+    id: '4',
+    title: 'Mobile Development',
+    description: 'Create native and cross-platform mobile apps',
+    icon: 'Smartphone',
+    progress: 0,
+    difficulty: 'Intermediate',
+    duration: '16 weeks',
+    skills: ['React Native', 'Flutter', 'iOS', 'Android', 'Expo', 'Native Modules']
+  },
+  {
+    id: '5',
+    title: 'DevOps & Cloud',
+    description: 'Learn deployment, monitoring, and cloud infrastructure',
+    icon: 'Cloud',
+    progress: 0,
+    difficulty: 'Advanced',
+    duration: '18 weeks',
+    skills: ['Docker', 'Kubernetes', 'AWS', 'CI/CD', 'Monitoring', 'Terraform']
+  },
+  {
+    id: '6',
+    title: 'Data Science',
+    description: 'Master data analysis, ML, and statistical modeling',
+    icon: 'BarChart',
+    progress: 0,
+    difficulty: 'Intermediate',
+    duration: '20 weeks',
+    skills: ['Python', 'Pandas', 'Machine Learning', 'Statistics', 'Jupyter', 'TensorFlow']
+  }
+];
+
+MOCK_LEARNING_TRACKS.forEach(track => Object.freeze(track));
+Object.freeze(MOCK_LEARNING_TRACKS);
+
 function getMockLearningTracks(): LearningTrack[] {
-  return [
-    {
-      id: '1',
-      title: 'Frontend Development',
-      description: 'Master React, TypeScript, and modern web development',
-      icon: 'Code',
-      progress: 0,
-      difficulty: 'Beginner',
-      duration: '12 weeks',
-      skills: ['React', 'TypeScript', 'CSS', 'JavaScript', 'Next.js', 'Tailwind CSS']
-    },
-    {
-      id: '2',
-      title: 'UX/UI Design',
-      description: 'Learn user experience design and interface creation',
-      icon: 'Palette',
-      progress: 0,
-      difficulty: 'Beginner',
-      duration: '10 weeks',
-      skills: ['Figma', 'Design Systems', 'User Research', 'Prototyping', 'Wireframing']
-    },
-    {
-      id: '3',
-      title: 'Backend Development',
-      description: 'Build scalable server-side applications',
-      icon: 'Database',
-      progress: 0,
-      difficulty: 'Intermediate',
-      duration: '14 weeks',
-      skills: ['Node.js', 'APIs', 'Databases', 'Authentication', 'Docker', 'AWS']
-    },
-    {
-      id: '4',
-      title: 'Mobile Development',
-      description: 'Create native and cross-platform mobile apps',
-      icon: 'Smartphone',
-      progress: 0,
-      difficulty: 'Intermediate',
-      duration: '16 weeks',
-      skills: ['React Native', 'Flutter', 'iOS', 'Android', 'Expo', 'Native Modules']
-    },
-    {
-      id: '5',
-      title: 'DevOps & Cloud',
-      description: 'Learn deployment, monitoring, and cloud infrastructure',
-      icon: 'Cloud',
-      progress: 0,
-      difficulty: 'Advanced',
-      duration: '18 weeks',
-      skills: ['Docker', 'Kubernetes', 'AWS', 'CI/CD', 'Monitoring', 'Terraform']
-    },
-    {
-      id: '6',
-      title: 'Data Science',
-      description: 'Master data analysis, ML, and statistical modeling',
-      icon: 'BarChart',
-      progress: 0,
-      difficulty: 'Intermediate',
-      duration: '20 weeks',
-      skills: ['Python', 'Pandas', 'Machine Learning', 'Statistics', 'Jupyter', 'TensorFlow']
-    }
-  ];
+  return [...MOCK_LEARNING_TRACKS];
 }
 
 function getMockUserProgress(userId: string): {
@@ -298,37 +309,42 @@ function getMockUserProgress(userId: string): {
   };
 }
 
+const MOCK_SKILL_ASSESSMENTS: readonly SkillAssessmentData[] = [
+  {
+    id: '1',
+    title: 'Frontend Foundations Assessment',
+    description: 'Evaluate your current knowledge of HTML, CSS, JavaScript, and React fundamentals',
+    estimatedTime: '15-20 minutes',
+    difficulty: 'Beginner',
+    skills: [
+      { skill: 'HTML/CSS', level: 3 },
+      { skill: 'JavaScript', level: 2 },
+      { skill: 'React', level: 1 },
+      { skill: 'TypeScript', level: 1 },
+      { skill: 'Git/Version Control', level: 2 }
+    ]
+  },
+  {
+    id: '2',
+    title: 'Advanced Frontend Skills',
+    description: 'Test your knowledge of advanced React patterns, state management, and performance optimization',
+    estimatedTime: '25-30 minutes',
+    difficulty: 'Advanced',
+    skills: [
+      { skill: 'React Advanced Patterns', level: 1 },
+      { skill: 'State Management (Redux/Zustand)', level: 1 },
+      { skill: 'Performance Optimization', level: 1 },
+      { skill: 'Testing (Jest/RTL)', level: 1 },
+      { skill: 'Build Tools (Webpack/Vite)', level: 1 }
+    ]
+  }
+];
+
+MOCK_SKILL_ASSESSMENTS.forEach(assessment => Object.freeze(assessment));
+Object.freeze(MOCK_SKILL_ASSESSMENTS);
+
 function getMockSkillAssessments(): SkillAssessmentData[] {
-  return [
-    {
-      id: '1',
-      title: 'Frontend Foundations Assessment',
-      description: 'Evaluate your current knowledge of HTML, CSS, JavaScript, and React fundamentals',
-      estimatedTime: '15-20 minutes',
-      difficulty: 'Beginner',
-      skills: [
-        { skill: 'HTML/CSS', level: 3 },
-        { skill: 'JavaScript', level: 2 },
-        { skill: 'React', level: 1 },
-        { skill: 'TypeScript', level: 1 },
-        { skill: 'Git/Version Control', level: 2 }
-      ]
-    },
-    {
-      id: '2',
-      title: 'Advanced Frontend Skills',
-      description: 'Test your knowledge of advanced React patterns, state management, and performance optimization',
-      estimatedTime: '25-30 minutes',
-      difficulty: 'Advanced',
-      skills: [
-        { skill: 'React Advanced Patterns', level: 1 },
-        { skill: 'State Management (Redux/Zustand)', level: 1 },
-        { skill: 'Performance Optimization', level: 1 },
-        { skill: 'Testing (Jest/RTL)', level: 1 },
-        { skill: 'Build Tools (Webpack/Vite)', level: 1 }
-      ]
-    }
-  ];
+  return [...MOCK_SKILL_ASSESSMENTS];
 }
 
 function getMockLearningPreferences(userId: string): LearningPreferences {
@@ -344,18 +360,15 @@ function getMockLearningPreferences(userId: string): LearningPreferences {
 
 // Cache revalidation functions for use in Server Actions
 export async function revalidateLearningTracks() {
-  const { revalidateTag } = await import('next/cache');
   revalidateTag(CACHE_TAGS.LEARNING_TRACKS);
 }
 
 export async function revalidateUserProgress(userId: string) {
-  const { revalidateTag } = await import('next/cache');
   revalidateTag(CACHE_TAGS.USER_PROGRESS);
   revalidateTag(`user-${userId}`);
 }
 
 export async function revalidateLearningPreferences(userId: string) {
-  const { revalidateTag } = await import('next/cache');
   revalidateTag(CACHE_TAGS.LEARNING_PREFERENCES);
   revalidateTag(`user-${userId}`);
 }
\ No newline at end of file
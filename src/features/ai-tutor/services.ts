@@ -5,14 +5,22 @@
 
 // import { agUiClient } from '@/lib/ag-ui-client'; // Example import
 
+// Stub logging is development-only noise; guard it so the per-message send
+// path (and module import) stays silent in production builds
+const DEBUG_LOGGING = process.env.NODE_ENV === 'development';
+
 class AgUiService {
   constructor() {
     // Initialize any necessary properties
-    console.log("AgUiService initialized (stub)");
+    if (DEBUG_LOGGING) {
+      console.log("AgUiService initialized (stub)");
+    }
   }
 
   async sendMessageToTutor(message: string): Promise<string> {
-    console.log(`AgUiService: Sending message to tutor "${message}" (stub)`);
+    if (DEBUG_LOGGING) {
+      console.log(`AgUiService: Sending message to tutor "${message}" (stub)`);
+    }
     // await agUiClient.sendMessage(message); // Example usage
     return Promise.resolve("AI Tutor response (stub)");
   }
@@ -21,4 +29,3 @@ class AgUiService {
 }
 
 export const agUiService = new AgUiService();
-console.log("AG-UI Service stub loaded.");
@@ -0,0 +1,111 @@
+// src/features/ai-tutor/stores/__tests__/chatStore.streaming.test.ts
+// Tests for the streaming message path in the chat store
+
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
+import { useChatStore } from '../chatStore';
+import { aiResponseCache } from '../../utils/responseCache';
+
+const resetChatState = () => {
+  useChatStore.setState({
+    tabMessages: {
+      home: [],
+      progress: [],
+      review: [],
+      explore: []
+    },
+    optimisticMessages: {
+      home: [],
+      progress: [],
+      review: [],
+      explore: []
+    },
+    activeTab: 'home',
+    isLoading: false,
+    isTyping: false,
+    error: null,
+    retryCount: 0
+  });
+};
+
+describe('chatStore streaming', () => {
+  beforeEach(() => {
+    resetChatState();
+    aiResponseCache.clear();
+    vi.useFakeTimers();
+  });
+
+  afterEach(() => {
+    vi.useRealTimers();
+    vi.restoreAllMocks();
+  });
+
+  describe('appendToMessage', () => {
+    it('should grow the target message in place and leave others untouched', () => {
+      useChatStore.setState({
+        tabMessages: {
+          home: [
+            { id: 'm1', content: 'Hello', type: 'ai', timestamp: new Date().toISOString() },
+            { id: 'm2', content: 'Other', type: 'ai', timestamp: new Date().toISOString() }
+          ],
+          progress: [],
+          review: [],
+          explore: []
+        }
+      });
+
+      useChatStore.getState().appendToMessage('home', 'm1', ' world');
+
+      const messages = useChatStore.getState().tabMessages.home;
+      expect(messages[0].content).toBe('Hello world');
+      expect(messages[1].content).toBe('Other');
+    });
+  });
+
+  describe('sendMessageStreaming', () => {
+    it('should create the AI message on the first chunk and grow it to the full response', async () => {
+      // Pin Math.random so delays are deterministic and the failure roll
+      // (0.5 >= 0.1) never trips
+      vi.spyOn(Math, 'random').mockReturnValue(0.5);
+
+      const promise = useChatStore.getState().sendMessageStreaming('home', 'hello stream');
+
+      // After the simulated time-to-first-token the AI message already
+      // exists, carrying only the first chunk
+      await vi.advanceTimersByTimeAsync(300);
+      const partial = useChatStore.getState().tabMessages.home.find(msg => msg.type === 'ai');
+      expect(partial).toBeDefined();
+      expect(partial!.content).toBe('AI');
+
+      await vi.runAllTimersAsync();
+      await promise;
+
+      // The same message grew in place to the full response
+      const final = useChatStore.getState().tabMessages.home.find(msg => msg.id === partial!.id);
+      expect(final!.content).toBe('AI response to: "hello stream"');
+      // The confirmed send cleared the optimistic user message
+      expect(useChatStore.getState().optimisticMessages.home).toEqual([]);
+      expect(useChatStore.getState().error).toBeNull();
+    });
+
+    it('should remove the partial AI message when the stream fails mid-response', async () => {
+      // Deterministic roll sequence: temp id, AI message id, first-token
+      // delay, then 0.05 on the failure roll so the stream drops partway
+      // through the reply; later rolls fall back to 0.5
+      const rolls = [0.5, 0.5, 0.5, 0.05];
+      vi.spyOn(Math, 'random').mockImplementation(() => (rolls.length > 0 ? rolls.shift()! : 0.5));
+
+      const promise = useChatStore.getState().sendMessageStreaming('home', 'doomed stream');
+
+      await vi.runAllTimersAsync();
+      await promise;
+
+      const state = useChatStore.getState();
+      // The partially streamed AI message was cleaned up
+      expect(state.tabMessages.home.filter(msg => msg.type === 'ai')).toEqual([]);
+      // The user message is kept in failed state so it can be retried
+      expect(state.optimisticMessages.home).toHaveLength(1);
+      expect(state.optimisticMessages.home[0].status).toBe('failed');
+      expect(state.error).toBe('Network connection failed. Please try again.');
+    });
+  });
+});
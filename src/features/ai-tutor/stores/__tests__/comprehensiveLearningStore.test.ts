@@ -1,7 +1,7 @@
 // src/features/ai-tutor/stores/__tests__/comprehensiveLearningStore.test.ts
 // Comprehensive Learning Store Tests (TDD) - TASK-010
 
-import { describe, it, expect, beforeEach, vi, afterEach } from 'vitest';
+import { describe, it, expect, beforeAll, beforeEach, vi, afterEach } from 'vitest';
 import type { 
   ComprehensiveLearningState,
   LearningPreferences,
@@ -175,9 +175,10 @@ const createMockComprehensiveLearningStore = (): ComprehensiveLearningState => {
 describe('Comprehensive Learning Store (TDD) - TASK-010', () => {
   let mockStore: ComprehensiveLearningState;
   
-  beforeEach(() => {
-    mockStore = createMockComprehensiveLearningStore();
-    vi.clearAllMocks();
+  // The storage mocks carry no per-test state (clearAllMocks wipes call
+  // history each test), so install them once for the suite instead of
+  // redefining the window properties before all 50+ tests
+  beforeAll(() => {
     // Mock localStorage
     const localStorageMock = {
       getItem: vi.fn(),
@@ -186,16 +187,24 @@ describe('Comprehensive Learning Store (TDD) - TASK-010', () => {
       clear: vi.fn()
     };
     Object.defineProperty(window, 'localStorage', { value: localStorageMock });
-    
-    // Mock IndexedDB for offline storage
+
+    // Mock IndexedDB for offline storage. indexedDB.open is synchronous
+    // (it returns a request object, not a promise), so a plain return
+    // value is the right shape and skips the promise machinery an async
+    // mock would allocate per call
     Object.defineProperty(window, 'indexedDB', {
       value: {
-        open: vi.fn().mockResolvedValue({}),
+        open: vi.fn().mockReturnValue({}),
         deleteDatabase: vi.fn()
       }
     });
   });
 
+  beforeEach(() => {
+    mockStore = createMockComprehensiveLearningStore();
+    vi.clearAllMocks();
+  });
+
   afterEach(() => {
     vi.restoreAllMocks();
   });
@@ -44,7 +44,9 @@ const createMockEnhancedChatStore = () => {
     
     // Combined actions
     sendMessageWithOptimistic: vi.fn().mockResolvedValue(undefined),
+    sendMessageStreaming: vi.fn().mockResolvedValue(undefined),
     retryMessage: vi.fn().mockResolvedValue(undefined),
+    appendToMessage: vi.fn(),
     
     // Selectors
     getTabMessages: vi.fn(),
@@ -3,49 +3,32 @@ import { create } from 'zustand';
 import { persist, createJSONStorage } from 'zustand/middleware';
 import { devtools } from 'zustand/middleware';
 import type { ChatState, TabType, Message, OptimisticMessage } from '../types';
+import { aiResponseCache } from '../utils/responseCache';
+
+// Static welcome content per tab, built once at module scope. Only the
+// timestamp is dynamic, so getInitialMessages doesn't rebuild all four
+// tabs' message lists just to pick one.
+const WELCOME_CONTENT: Record<TabType, string> = {
+  home: 'Welcome to your AI Tutor! I\'m here to help you learn and grow. What would you like to explore today?',
+  progress: 'Track your learning journey here! I can show you detailed progress reports, achievements, and recommend areas for improvement.',
+  review: 'Ready to review and reinforce your knowledge? I can create custom flashcards and practice sessions based on your learning history.',
+  explore: 'Let\'s discover new learning tracks together! I can recommend personalized learning paths based on your interests and goals.'
+};
 
 // Helper function to generate initial messages for each tab
 const getInitialMessages = (tab: TabType): Message[] => {
-  const baseMessages: Record<TabType, Message[]> = {
-    home: [
-      {
-        id: 'welcome-home',
-        content: 'Welcome to your AI Tutor! I\'m here to help you learn and grow. What would you like to explore today?',
-        type: 'ai',
-        timestamp: new Date().toISOString(),
-        metadata: { isWelcome: true }
-      }
-    ],
-    progress: [
-      {
-        id: 'welcome-progress',
-        content: 'Track your learning journey here! I can show you detailed progress reports, achievements, and recommend areas for improvement.',
-        type: 'ai',
-        timestamp: new Date().toISOString(),
-        metadata: { isWelcome: true }
-      }
-    ],
-    review: [
-      {
-        id: 'welcome-review',
-        content: 'Ready to review and reinforce your knowledge? I can create custom flashcards and practice sessions based on your learning history.',
-        type: 'ai',
-        timestamp: new Date().toISOString(),
-        metadata: { isWelcome: true }
-      }
-    ],
-    explore: [
-      {
-        id: 'welcome-explore',
-        content: 'Let\'s discover new learning tracks together! I can recommend personalized learning paths based on your interests and goals.',
-        type: 'ai',
-        timestamp: new Date().toISOString(),
-        metadata: { isWelcome: true }
-      }
-    ]
-  };
-  
-  return baseMessages[tab] || [];
+  const content = WELCOME_CONTENT[tab];
+  if (!content) return [];
+
+  return [
+    {
+      id: `welcome-${tab}`,
+      content,
+      type: 'ai',
+      timestamp: new Date().toISOString(),
+      metadata: { isWelcome: true }
+    }
+  ];
 };
 
 // Helper functions for optimistic message management
@@ -54,20 +37,75 @@ const generateTempId = (): string => {
 };
 
 const simulateAPICall = async (content: string): Promise<Message> => {
+  // Near-duplicate requests short-circuit to the cached response, skipping
+  // the simulated network round-trip entirely
+  const cachedContent = aiResponseCache.get(content);
+  if (cachedContent !== null) {
+    return {
+      id: `ai-${Date.now()}-${Math.random().toString(36).substr(2, 9)}`,
+      content: cachedContent,
+      type: 'ai',
+      timestamp: new Date().toISOString(),
+    };
+  }
+
   // Simulate network delay
   await new Promise(resolve => setTimeout(resolve, 800 + Math.random() * 400));
-  
+
   // Simulate 10% failure rate for testing
   if (Math.random() < 0.1) {
     throw new Error('Network connection failed. Please try again.');
   }
-  
-  return {
+
+  const response: Message = {
     id: `ai-${Date.now()}-${Math.random().toString(36).substr(2, 9)}`,
     content: `AI response to: "${content}"`,
     type: 'ai',
     timestamp: new Date().toISOString(),
   };
+
+  aiResponseCache.set(content, response.content);
+
+  return response;
+};
+
+// Streaming variant of simulateAPICall: emits the response in small chunks
+// via onDelta so the UI can render the first words while the rest is still
+// "generating", instead of waiting for the whole reply
+const simulateStreamingAPICall = async (
+  content: string,
+  onDelta: (delta: string) => void
+): Promise<string> => {
+  // Cache hits stream instantly as a single chunk
+  const cachedContent = aiResponseCache.get(content);
+  if (cachedContent !== null) {
+    onDelta(cachedContent);
+    return cachedContent;
+  }
+
+  // Simulate time-to-first-token, much shorter than the full response time
+  await new Promise(resolve => setTimeout(resolve, 200 + Math.random() * 200));
+
+  const fullContent = `AI response to: "${content}"`;
+  const words = fullContent.split(' ');
+
+  // Simulate 10% failure rate for testing. Streams die mid-response, so a
+  // failing stream drops the connection partway through the reply rather
+  // than before the first chunk
+  const failAtChunk = Math.random() < 0.1 ? Math.floor(words.length / 2) : -1;
+
+  for (let i = 0; i < words.length; i++) {
+    if (i === failAtChunk) {
+      throw new Error('Network connection failed. Please try again.');
+    }
+    onDelta(i === 0 ? words[i] : ` ${words[i]}`);
+    // Simulate per-token decode delay
+    await new Promise(resolve => setTimeout(resolve, 30 + Math.random() * 40));
+  }
+
+  aiResponseCache.set(content, fullContent);
+
+  return fullContent;
 };
 
 // Store implementation with optimistic updates and enhanced functionality
@@ -121,6 +159,22 @@ export const useChatStore = create<ChatState>()(
             `removeMessage/${tab}/${messageId}`
           ),
 
+        appendToMessage: (tab: TabType, messageId: string, delta: string) =>
+          set(
+            (state) => ({
+              tabMessages: {
+                ...state.tabMessages,
+                [tab]: state.tabMessages[tab].map(msg =>
+                  msg.id === messageId
+                    ? { ...msg, content: msg.content + delta }
+                    : msg
+                )
+              }
+            }),
+            false,
+            `appendToMessage/${tab}/${messageId}`
+          ),
+
         clearMessages: (tab: TabType) =>
           set(
             (state) => ({
@@ -250,6 +304,74 @@ export const useChatStore = create<ChatState>()(
           }
         },
 
+        // Streaming variant: the AI message appears as soon as the first
+        // chunk arrives and grows in place, so perceived latency is
+        // time-to-first-chunk rather than time-to-full-response
+        sendMessageStreaming: async (tab: TabType, content: string, component?: React.ReactNode) => {
+          const { addOptimisticMessage, updateOptimisticMessage, addMessage, appendToMessage, setTyping, setError } = get();
+
+          // Create optimistic user message
+          const tempId = generateTempId();
+          const optimisticUserMessage: OptimisticMessage = {
+            id: tempId,
+            tempId,
+            type: 'user',
+            content,
+            timestamp: new Date(),
+            status: 'pending',
+            component
+          };
+
+          addOptimisticMessage(tab, optimisticUserMessage);
+
+          const aiMessageId = `ai-${Date.now()}-${Math.random().toString(36).substr(2, 9)}`;
+          let aiMessageAdded = false;
+
+          try {
+            setTyping(true);
+            setError(null);
+
+            // Update user message to sent
+            updateOptimisticMessage(tab, tempId, { status: 'sent' });
+
+            await simulateStreamingAPICall(content, (delta) => {
+              if (!aiMessageAdded) {
+                // First chunk: create the AI message immediately
+                addMessage(tab, {
+                  id: aiMessageId,
+                  content: delta,
+                  type: 'ai',
+                  timestamp: new Date().toISOString(),
+                });
+                aiMessageAdded = true;
+              } else {
+                appendToMessage(tab, aiMessageId, delta);
+              }
+            });
+
+            // Remove optimistic user message (now that it's confirmed)
+            get().removeOptimisticMessage(tab, tempId);
+
+          } catch (error) {
+            const errorMessage = error instanceof Error ? error.message : 'Something went wrong';
+
+            // Drop the partial AI message if the stream died mid-response
+            if (aiMessageAdded) {
+              get().removeMessage(tab, aiMessageId);
+            }
+
+            // Update optimistic message to failed
+            updateOptimisticMessage(tab, tempId, {
+              status: 'failed',
+              error: errorMessage
+            });
+
+            setError(errorMessage);
+          } finally {
+            setTyping(false);
+          }
+        },
+
         retryMessage: async (tab: TabType, message: OptimisticMessage) => {
           const { updateOptimisticMessage, addMessage, setTyping, setError } = get();
           
@@ -303,16 +425,20 @@ export const useChatStore = create<ChatState>()(
           const regularMessages = get().tabMessages[tab];
           const optimisticMessages = get().optimisticMessages[tab];
           
-          // Combine and sort by timestamp
+          // Combine and sort by timestamp. Parse each timestamp exactly once
+          // up front; doing it inside the comparator would re-run Date
+          // construction O(n log n) times per selector call.
           const combined = [
             ...regularMessages.map(msg => ({ ...msg, timestamp: new Date(msg.timestamp) })) as (Message | OptimisticMessage)[],
             ...optimisticMessages
-          ].sort((a, b) => {
-            const aTime = a.timestamp instanceof Date ? a.timestamp.getTime() : new Date(a.timestamp).getTime();
-            const bTime = b.timestamp instanceof Date ? b.timestamp.getTime() : new Date(b.timestamp).getTime();
-            return aTime - bTime;
-          });
-          
+          ]
+            .map(msg => ({
+              msg,
+              time: msg.timestamp instanceof Date ? msg.timestamp.getTime() : new Date(msg.timestamp).getTime(),
+            }))
+            .sort((a, b) => a.time - b.time)
+            .map(entry => entry.msg);
+
           return combined;
         },
         
@@ -459,6 +585,7 @@ export const useChatActions = () => {
     
     // Combined actions (recommended for components)
     sendMessageWithOptimistic: store.sendMessageWithOptimistic,
+    sendMessageStreaming: store.sendMessageStreaming,
     retryMessage: store.retryMessage,
     
     // Convenience methods for quick message creation
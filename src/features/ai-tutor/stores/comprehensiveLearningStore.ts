@@ -856,8 +856,13 @@ useComprehensiveLearningStore.subscribe(
       useComprehensiveLearningStore.setState({ learningGoals: updatedGoals });
     }
   },
-  { equalityFn: (a, b) => 
-    JSON.stringify(a) === JSON.stringify(b)
+  // The store replaces these slices immutably, so reference checks are
+  // enough; serializing all three records with JSON.stringify on every
+  // store update was pure CPU overhead on the hot path
+  { equalityFn: (a, b) =>
+    a.progress === b.progress &&
+    a.lessonProgress === b.lessonProgress &&
+    a.assessmentResults === b.assessmentResults
   }
 );
 
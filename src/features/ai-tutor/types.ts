@@ -132,7 +132,9 @@ export interface ChatState {
   
   // Combined actions (optimistic + regular)
   sendMessageWithOptimistic: (tab: TabType, content: string, component?: React.ReactNode) => Promise<void>;
+  sendMessageStreaming: (tab: TabType, content: string, component?: React.ReactNode) => Promise<void>;
   retryMessage: (tab: TabType, message: OptimisticMessage) => Promise<void>;
+  appendToMessage: (tab: TabType, messageId: string, delta: string) => void;
   
   // Selectors
   getTabMessages: (tab: TabType) => Message[];
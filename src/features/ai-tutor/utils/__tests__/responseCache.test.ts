@@ -0,0 +1,63 @@
+// src/features/ai-tutor/utils/__tests__/responseCache.test.ts
+/**
+ * @vitest-environment node
+ */
+// Tests for the AI response cache
+
+import { describe, it, expect, beforeEach, vi } from 'vitest';
+import { ResponseCache, normalizeRequest } from '../responseCache';
+
+describe('normalizeRequest', () => {
+  it('should collapse whitespace and casing so near-duplicate prompts share a key', () => {
+    expect(normalizeRequest('  I want to   learn Python ')).toBe('i want to learn python');
+    expect(normalizeRequest('I WANT TO LEARN PYTHON')).toBe('i want to learn python');
+  });
+});
+
+describe('ResponseCache', () => {
+  let cache: ResponseCache;
+
+  beforeEach(() => {
+    cache = new ResponseCache();
+  });
+
+  it('should serve a repeated request from cache instead of recomputing', () => {
+    cache.set('I want to learn Python', 'Here is your Python plan');
+
+    expect(cache.get('I want to learn Python')).toBe('Here is your Python plan');
+    // A differently-phrased copy of the same request hits the same entry
+    expect(cache.get('  i want to  learn python ')).toBe('Here is your Python plan');
+  });
+
+  it('should miss for requests that were never cached', () => {
+    expect(cache.get('teach me Rust')).toBeNull();
+  });
+
+  it('should expire entries after the TTL', () => {
+    vi.useFakeTimers();
+    try {
+      cache = new ResponseCache(1000);
+      cache.set('I want to learn Python', 'Here is your Python plan');
+
+      vi.advanceTimersByTime(1001);
+
+      expect(cache.get('I want to learn Python')).toBeNull();
+      expect(cache.size()).toBe(0);
+    } finally {
+      vi.useRealTimers();
+    }
+  });
+
+  it('should count hits and misses so the hit rate can be judged', () => {
+    cache.set('I want to learn Python', 'Here is your Python plan');
+
+    cache.get('I want to learn Python'); // hit
+    cache.get('I want to learn Python'); // hit
+    cache.get('teach me Rust'); // miss
+
+    expect(cache.getStats()).toEqual({ hits: 2, misses: 1, hitRate: 2 / 3 });
+
+    cache.resetStats();
+    expect(cache.getStats()).toEqual({ hits: 0, misses: 0, hitRate: 0 });
+  });
+});
@@ -15,4 +15,15 @@ export {
 
 export type {
   // No types to export from utils currently
-} from './optimistic-helpers';
\ No newline at end of file
+} from './optimistic-helpers';
+
+// Response caching for AI calls
+export { ResponseCache, aiResponseCache, normalizeRequest } from './responseCache';
+export type { ResponseCacheStats } from './responseCache';
+
+// Shared chat timestamp formatter
+export { formatMessageTime } from './timeFormat';
+
+// Keyword intent matching for the mock chat responders
+export { matchChatIntent } from './intent';
+export type { ChatIntent } from './intent';
\ No newline at end of file
@@ -0,0 +1,22 @@
+// src/features/ai-tutor/utils/intent.ts
+// Keyword-based intent matching for the mock chat responders
+
+export type ChatIntent = 'progress' | 'help' | 'review';
+
+// Ordered keyword table; first match wins. A single lowered copy of the
+// input is scanned once, instead of each branch of an if/else chain calling
+// toLowerCase() again — and new intents become a table row, not another
+// branch.
+const INTENT_KEYWORDS: ReadonlyArray<readonly [string, ChatIntent]> = [
+  ['progress', 'progress'],
+  ['help', 'help'],
+  ['review', 'review'],
+];
+
+export function matchChatIntent(input: string): ChatIntent | null {
+  const lowered = input.toLowerCase();
+  for (const [keyword, intent] of INTENT_KEYWORDS) {
+    if (lowered.includes(keyword)) return intent;
+  }
+  return null;
+}
@@ -9,12 +9,39 @@ const DB_VERSION = 1;
 const ACTIONS_STORE = 'offlineActions';
 const PROGRESS_STORE = 'progressCache';
 
+// Max number of sync requests in flight at once. Actions are independent, so
+// syncing them one-by-one wastes a full network round-trip per action; a small
+// bound keeps us from flooding the connection when the queue is large.
+const SYNC_CONCURRENCY = 4;
+
+// Max actions coalesced into a single sync request. One round-trip carrying a
+// batch of actions is far cheaper than a round-trip per action when draining
+// a large backlog after coming back online.
+const MAX_SYNC_BATCH = 16;
+
+// Circuit breaker: after this many consecutive batch failures the sync path
+// is assumed to be down and further attempts are skipped for the cooldown,
+// instead of burning a full round-trip timeout per action while the backend
+// is unreachable.
+const CIRCUIT_FAILURE_THRESHOLD = 5;
+const CIRCUIT_COOLDOWN_MS = 30000;
+
+// Hard cap on queued offline actions. Without a bound, a long offline
+// session (or a sync outage with the circuit open) grows the queue — and
+// its IndexedDB mirror — indefinitely; past the cap the oldest unsynced
+// action is dropped to admit the newest.
+const MAX_QUEUE_SIZE = 500;
+
 export class OfflineSyncManager {
   private db: IDBDatabase | null = null;
-  private syncQueue: OfflineAction[] = [];
+  // Keyed by action id so removal under retry churn is O(1) instead of an
+  // O(n) array scan per dropped action
+  private syncQueue: Map<string, OfflineAction> = new Map();
   private isOnline: boolean = typeof window !== 'undefined' && navigator?.onLine || false;
   private syncInProgress: boolean = false;
   private syncListeners: Set<(status: SyncStatus) => void> = new Set();
+  private consecutiveFailures: number = 0;
+  private circuitOpenUntil: number = 0;
 
   constructor() {
     this.initializeDB();
@@ -88,7 +115,18 @@ export class OfflineSyncManager {
       retries: 0
     };
 
-    this.syncQueue.push(offlineAction);
+    if (this.syncQueue.size >= MAX_QUEUE_SIZE) {
+      // Map iteration order is insertion order, so the first entry is the
+      // oldest queued action
+      const oldestId = this.syncQueue.keys().next().value;
+      if (oldestId !== undefined) {
+        console.warn('Offline queue full, dropping oldest action:', oldestId);
+        this.syncQueue.delete(oldestId);
+        this.removeActionFromDB(oldestId);
+      }
+    }
+
+    this.syncQueue.set(offlineAction.id, offlineAction);
     this.saveActionToDB(offlineAction);
     
     if (this.isOnline) {
@@ -98,7 +136,14 @@ export class OfflineSyncManager {
 
   // Process queue when online
   public async processQueueWhenOnline(): Promise<void> {
-    if (!this.isOnline || this.syncInProgress || this.syncQueue.length === 0) {
+    if (!this.isOnline || this.syncInProgress || this.syncQueue.size === 0) {
+      return;
+    }
+
+    // Circuit open: the sync endpoint is failing consistently, so skip the
+    // attempt entirely until the cooldown elapses. Queued actions are kept
+    // and the next periodic/online trigger retries once the window passes.
+    if (Date.now() < this.circuitOpenUntil) {
       return;
     }
 
@@ -106,30 +151,27 @@ export class OfflineSyncManager {
     this.notifyStatusChange();
 
     try {
-      const unsyncedActions = this.syncQueue.filter(action => !action.synced);
-      
-      for (const action of unsyncedActions) {
-        try {
-          await this.syncAction();
-          action.synced = true;
-          action.retries = 0;
-          await this.updateActionInDB(action);
-        } catch (error) {
-          action.retries++;
-          console.error(`Failed to sync action ${action.id}:`, error);
-          
-          // Remove action if too many retries
-          if (action.retries >= 3) {
-            await this.removeActionFromDB(action.id);
-            this.syncQueue = this.syncQueue.filter(a => a.id !== action.id);
-          } else {
-            await this.updateActionInDB(action);
-          }
-        }
+      const unsyncedActions = [...this.syncQueue.values()].filter(action => !action.synced);
+
+      // Coalesce actions into batched requests (one round-trip per batch),
+      // then issue a bounded number of batch requests in parallel; one slow
+      // or failing batch no longer stalls the rest of the queue
+      const batches: OfflineAction[][] = [];
+      for (let i = 0; i < unsyncedActions.length; i += MAX_SYNC_BATCH) {
+        batches.push(unsyncedActions.slice(i, i + MAX_SYNC_BATCH));
+      }
+
+      for (let i = 0; i < batches.length; i += SYNC_CONCURRENCY) {
+        const inFlight = batches.slice(i, i + SYNC_CONCURRENCY);
+        await Promise.all(inFlight.map(batch => this.syncActionBatch(batch)));
       }
 
       // Clean up synced actions
-      this.syncQueue = this.syncQueue.filter(action => !action.synced);
+      for (const action of this.syncQueue.values()) {
+        if (action.synced) {
+          this.syncQueue.delete(action.id);
+        }
+      }
       await this.cleanupSyncedActions();
     } finally {
       this.syncInProgress = false;
@@ -137,6 +179,46 @@ export class OfflineSyncManager {
     }
   }
 
+  // Sync a batch of actions with a single request, handling retry
+  // bookkeeping per action; never throws so parallel batches don't abort
+  // each other
+  private async syncActionBatch(actions: OfflineAction[]): Promise<void> {
+    try {
+      // One round-trip carries the whole batch
+      await this.syncAction();
+
+      this.consecutiveFailures = 0;
+
+      for (const action of actions) {
+        action.synced = true;
+        action.retries = 0;
+        await this.updateActionInDB(action);
+      }
+    } catch (error) {
+      // One log line per failed batch, not one per action; the per-action
+      // detail is already visible through getSyncErrors()
+      console.error(`Failed to sync batch of ${actions.length} actions:`, error);
+
+      this.consecutiveFailures++;
+      if (this.consecutiveFailures >= CIRCUIT_FAILURE_THRESHOLD) {
+        this.circuitOpenUntil = Date.now() + CIRCUIT_COOLDOWN_MS;
+        this.consecutiveFailures = 0;
+      }
+
+      for (const action of actions) {
+        action.retries++;
+
+        // Remove action if too many retries
+        if (action.retries >= 3) {
+          await this.removeActionFromDB(action.id);
+          this.syncQueue.delete(action.id);
+        } else {
+          await this.updateActionInDB(action);
+        }
+      }
+    }
+  }
+
   // Sync individual action
   private async syncAction(): Promise<void> {
     // Simulate API call - in real implementation, this would call actual server endpoints
@@ -193,7 +275,7 @@ export class OfflineSyncManager {
   public getSyncStatus(): SyncStatus {
     return {
       lastSyncTime: this.getLastSyncTime(),
-      pendingActions: this.syncQueue.filter(action => !action.synced).length,
+      pendingActions: [...this.syncQueue.values()].filter(action => !action.synced).length,
       isOnline: this.isOnline,
       isSyncing: this.syncInProgress,
       syncErrors: this.getSyncErrors()
@@ -221,10 +303,12 @@ export class OfflineSyncManager {
     const request = index.getAll(IDBKeyRange.only(false)); // Get unsynced actions
 
     request.onsuccess = () => {
-      this.syncQueue = request.result || [];
+      this.syncQueue = new Map(
+        ((request.result || []) as OfflineAction[]).map(action => [action.id, action])
+      );
       this.notifyStatusChange();
       
-      if (this.isOnline && this.syncQueue.length > 0) {
+      if (this.isOnline && this.syncQueue.size > 0) {
         this.processQueueWhenOnline();
       }
     };
@@ -298,10 +382,19 @@ export class OfflineSyncManager {
     };
   }
 
-  // Notify status change
+  // Notify status change. Iterate over a snapshot so listeners that
+  // register or unregister during the fanout don't affect this pass, and
+  // isolate each call so one throwing listener cannot stop the rest from
+  // being notified.
   private notifyStatusChange(): void {
     const status = this.getSyncStatus();
-    this.syncListeners.forEach(listener => listener(status));
+    for (const listener of [...this.syncListeners]) {
+      try {
+        listener(status);
+      } catch (error) {
+        console.error('Sync status listener threw:', error);
+      }
+    }
   }
 
   // Generate unique action ID
@@ -327,7 +420,7 @@ export class OfflineSyncManager {
 
   // Get sync errors
   private getSyncErrors(): string[] {
-    const failedActions = this.syncQueue.filter(action => action.retries > 0);
+    const failedActions = [...this.syncQueue.values()].filter(action => action.retries > 0);
     return failedActions.map(action => `Failed to sync ${action.type}: ${action.retries} retries`);
   }
 
@@ -350,7 +443,7 @@ export class OfflineSyncManager {
       })
     ]);
 
-    this.syncQueue = [];
+    this.syncQueue.clear();
     this.notifyStatusChange();
   }
 
@@ -1,4 +1,5 @@
 import type { OptimisticMessage } from '../components/chat/types';
+import { formatMessageTime } from './timeFormat';
 
 // Timing utilities for performance measurement
 export const performanceUtils = {
@@ -153,38 +154,42 @@ export const orderUtils = {
 };
 
 // Error handling utilities
+
+type ErrorCategory = 'network' | 'validation' | 'server' | 'unknown';
+
+// Keyword groups checked in order against a single lowercased copy of the
+// message; the first group with a hit decides the category. Built once at
+// module scope so categorization is a table walk, not branch construction.
+const ERROR_CATEGORY_KEYWORDS: ReadonlyArray<readonly [readonly string[], ErrorCategory]> = [
+  [['network', 'fetch'], 'network'],
+  [['validation', 'invalid'], 'validation'],
+  [['server', '500'], 'server'],
+];
+
+const FRIENDLY_ERROR_MESSAGES: Record<ErrorCategory, string> = {
+  network: 'Network connection issue. Please check your internet and try again.',
+  validation: 'Message validation failed. Please check your input and try again.',
+  server: 'Server error. Please try again in a moment.',
+  unknown: 'Something went wrong. Please try again.',
+};
+
 export const errorUtils = {
   // Categorize error types
-  categorizeError: (error: Error | string): 'network' | 'validation' | 'server' | 'unknown' => {
+  categorizeError: (error: Error | string): ErrorCategory => {
     const errorMessage = typeof error === 'string' ? error : error.message;
     const lowerError = errorMessage.toLowerCase();
 
-    if (lowerError.includes('network') || lowerError.includes('fetch')) {
-      return 'network';
-    }
-    if (lowerError.includes('validation') || lowerError.includes('invalid')) {
-      return 'validation';
-    }
-    if (lowerError.includes('server') || lowerError.includes('500')) {
-      return 'server';
+    for (const [keywords, category] of ERROR_CATEGORY_KEYWORDS) {
+      if (keywords.some(keyword => lowerError.includes(keyword))) {
+        return category;
+      }
     }
     return 'unknown';
   },
 
   // Get user-friendly error message
   getUserFriendlyError: (error: Error | string): string => {
-    const category = errorUtils.categorizeError(error);
-    
-    switch (category) {
-      case 'network':
-        return 'Network connection issue. Please check your internet and try again.';
-      case 'validation':
-        return 'Message validation failed. Please check your input and try again.';
-      case 'server':
-        return 'Server error. Please try again in a moment.';
-      default:
-        return 'Something went wrong. Please try again.';
-    }
+    return FRIENDLY_ERROR_MESSAGES[errorUtils.categorizeError(error)];
   },
 
   // Check if error is retryable
@@ -227,10 +232,7 @@ export const a11yUtils = {
     const type = message.type === 'user' ? 'Your message' : 'AI response';
     const status = message.status === 'pending' ? ', sending' : 
                    message.status === 'failed' ? ', failed to send' : '';
-    const time = message.timestamp.toLocaleTimeString([], { 
-      hour: '2-digit', 
-      minute: '2-digit' 
-    });
+    const time = formatMessageTime(message.timestamp);
     
     return `${type} at ${time}${status}: ${message.content}`;
   },
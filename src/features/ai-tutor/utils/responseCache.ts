@@ -0,0 +1,96 @@
+// src/features/ai-tutor/utils/responseCache.ts
+// Response cache for AI tutor replies
+//
+// Learning requests cluster around a handful of intents ("I want to learn
+// Python", "teach me python please"), so near-duplicate prompts can be served
+// from cache instead of paying the full AI round-trip on every send.
+// Keys are normalized (trimmed, lowercased, whitespace-collapsed) so trivially
+// different phrasings of the same request hit the same entry. Entries carry a
+// TTL so stale responses expire instead of living forever.
+
+interface ResponseCacheEntry {
+  content: string;
+  expires: number;
+}
+
+export interface ResponseCacheStats {
+  hits: number;
+  misses: number;
+  hitRate: number;
+}
+
+const DEFAULT_TTL = 5 * 60 * 1000; // 5 minutes
+
+/**
+ * Normalize a learning request so near-duplicate phrasings share a cache key
+ */
+export function normalizeRequest(content: string): string {
+  return content.trim().toLowerCase().replace(/\s+/g, ' ');
+}
+
+export class ResponseCache {
+  private cache = new Map<string, ResponseCacheEntry>();
+  private ttl: number;
+  private hits = 0;
+  private misses = 0;
+
+  constructor(ttl: number = DEFAULT_TTL) {
+    this.ttl = ttl;
+  }
+
+  get(content: string): string | null {
+    const key = normalizeRequest(content);
+    const entry = this.cache.get(key);
+    if (!entry) {
+      this.misses++;
+      return null;
+    }
+
+    if (Date.now() > entry.expires) {
+      this.cache.delete(key);
+      this.misses++;
+      return null;
+    }
+
+    this.hits++;
+    return entry.content;
+  }
+
+  set(content: string, response: string): void {
+    this.cache.set(normalizeRequest(content), {
+      content: response,
+      expires: Date.now() + this.ttl,
+    });
+  }
+
+  delete(content: string): void {
+    this.cache.delete(normalizeRequest(content));
+  }
+
+  clear(): void {
+    this.cache.clear();
+  }
+
+  size(): number {
+    return this.cache.size;
+  }
+
+  // Hit-rate instrumentation: a cache that never hits is pure overhead, so
+  // expose enough to judge whether the normalization is earning its keep
+  getStats(): ResponseCacheStats {
+    const lookups = this.hits + this.misses;
+    return {
+      hits: this.hits,
+      misses: this.misses,
+      hitRate: lookups === 0 ? 0 : this.hits / lookups,
+    };
+  }
+
+  resetStats(): void {
+    this.hits = 0;
+    this.misses = 0;
+  }
+}
+
+// Shared cache instance for the chat store's AI call path
+export const aiResponseCache = new ResponseCache();
@@ -0,0 +1,14 @@
+// src/features/ai-tutor/utils/timeFormat.ts
+// Shared timestamp formatting for chat messages
+
+// toLocaleTimeString constructs a fresh Intl.DateTimeFormat on every call,
+// and message lists render one timestamp per message. Reusing a single
+// formatter instance avoids that per-message construction cost.
+const MESSAGE_TIME_FORMAT = new Intl.DateTimeFormat(undefined, {
+  hour: '2-digit',
+  minute: '2-digit',
+});
+
+export function formatMessageTime(timestamp: Date): string {
+  return MESSAGE_TIME_FORMAT.format(timestamp);
+}
@@ -346,6 +346,8 @@ export class AnalyticsManager {
           'Content-Type': 'application/json',
         },
         body: JSON.stringify({ events }),
+        // Let the request outlive page navigation so final flushes aren't dropped
+        keepalive: true,
       });
 
       if (this.config.enableConsoleLogging) {
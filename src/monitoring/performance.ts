@@ -379,6 +379,8 @@ export class PerformanceMonitor {
           'Content-Type': 'application/json',
         },
         body: JSON.stringify(metric),
+        // Survive page unload so trailing metrics aren't lost
+        keepalive: true,
       });
     } catch (error) {
       console.warn('Failed to report performance metric:', error);
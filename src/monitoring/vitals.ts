@@ -39,7 +39,8 @@ const DEFAULT_CONFIG: VitalsConfig = {
 export class WebVitalsManager {
   private config: VitalsConfig;
   private metrics: Map<string, Metric> = new Map();
-  private callbacks: Array<(metric: Metric) => void> = [];
+  // A Set keeps unsubscribe O(1) instead of an O(n) indexOf/splice scan
+  private callbacks: Set<(metric: Metric) => void> = new Set();
 
   constructor(config: Partial<VitalsConfig> = {}) {
     this.config = { ...DEFAULT_CONFIG, ...config };
@@ -130,21 +131,39 @@ export class WebVitalsManager {
    * Report critical metrics that need immediate attention
    */
   private async reportCriticalMetric(metric: Metric, rating: string): Promise<void> {
+    const body = JSON.stringify({
+      metric: metric.name,
+      value: metric.value,
+      rating,
+      id: metric.id,
+      url: window.location.href,
+      userAgent: navigator.userAgent,
+      timestamp: Date.now(),
+    });
+
+    // Prefer sendBeacon: the browser queues the payload and delivers it in
+    // the background, so reporting never blocks the main thread or competes
+    // with the navigation that often triggers a poor rating
+    if (typeof navigator !== 'undefined' && typeof navigator.sendBeacon === 'function') {
+      // Wrap the payload in a Blob so the beacon ships with the same
+      // application/json content type as the fetch fallback; a bare string
+      // would go out as text/plain
+      const beaconBody = new Blob([body], { type: 'application/json' });
+      if (navigator.sendBeacon('/api/vitals/critical', beaconBody)) {
+        return;
+      }
+    }
+
     try {
       await fetch('/api/vitals/critical', {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
         },
-        body: JSON.stringify({
-          metric: metric.name,
-          value: metric.value,
-          rating,
-          id: metric.id,
-          url: window.location.href,
-          userAgent: navigator.userAgent,
-          timestamp: Date.now(),
-        }),
+        body,
+        // Critical metrics often fire right before navigation; keepalive
+        // lets the browser finish the send after the page unloads
+        keepalive: true,
       });
     } catch (error) {
       console.warn('Failed to report critical metric:', error);
@@ -155,14 +174,11 @@ export class WebVitalsManager {
    * Register a callback for metric updates
    */
   onMetric(callback: (metric: Metric) => void): () => void {
-    this.callbacks.push(callback);
+    this.callbacks.add(callback);
 
     // Return unsubscribe function
     return () => {
-      const index = this.callbacks.indexOf(callback);
-      if (index > -1) {
-        this.callbacks.splice(index, 1);
-      }
+      this.callbacks.delete(callback);
     };
   }
 
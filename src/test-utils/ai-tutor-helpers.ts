@@ -1,9 +1,18 @@
 import { screen, fireEvent, waitFor } from '@testing-library/react';
 import '@testing-library/jest-dom';
 
+// The tab names form a fixed union, so compile each matcher once at module
+// scope instead of building a new RegExp on every navigation call
+const TAB_NAME_REGEXES = {
+  Home: /Home/i,
+  Progress: /Progress/i,
+  Review: /Review/i,
+  Explore: /Explore/i,
+} as const;
+
 // Example: Helper to navigate to a specific tab in AITutorChat
 export const navigateToAITutorTab = async (tabName: 'Home' | 'Progress' | 'Review' | 'Explore') => {
-  const tabRegex = new RegExp(tabName, "i");
+  const tabRegex = TAB_NAME_REGEXES[tabName];
   const tabElement = screen.getByRole('tab', { name: tabRegex });
   fireEvent.click(tabElement);
   await waitFor(() => {
@@ -6,6 +6,11 @@ import { Flashcard } from '@/features/ai-tutor/components/learning/FlashcardRevi
 
 // Consistent mock data factories
 
+// React elements are immutable once created, so build the default track icon
+// once and share it across every factory call instead of re-creating an
+// element per mock track
+const MOCK_TRACK_ICON = React.createElement('svg', { 'data-testid': 'mock-track-icon' });
+
 /**
  * Creates a mock AI Tutor message object.
  * Aligns with the Message interface from AITutorChat.
@@ -27,7 +32,7 @@ export const createMockLearningTrack = (overrides: Partial<ExplorationLearningTr
   id: `track-${Math.random().toString(36).substr(2, 9)}`,
   title: 'Default Test Track',
   description: 'A comprehensive description for the default test track.',
-  icon: React.createElement('svg', { 'data-testid': 'mock-track-icon' }), // Default mock icon
+  icon: MOCK_TRACK_ICON, // Default mock icon
   progress: 0,
   difficulty: 'Beginner',
   duration: '4 weeks',
@@ -175,13 +175,32 @@ export function useComponentCache<T>(): T | null {
 
 /**
  * Memory cache for client-side caching
+ *
+ * Bounded with LRU eviction: Map iteration order is insertion order, and
+ * hits re-insert their entry, so the first key is always the least
+ * recently used when the cache is full.
  */
 class MemoryCache {
   private cache = new Map<string, { value: unknown; expires: number }>();
+  private maxEntries: number;
+
+  constructor(maxEntries: number = 1024) {
+    this.maxEntries = maxEntries;
+  }
 
   set(key: string, value: unknown, ttl: number = 300000): void { // 5 minutes default
     const expires = Date.now() + ttl;
+
+    // Re-inserting moves the key to the back of the iteration order
+    this.cache.delete(key);
     this.cache.set(key, { value, expires });
+
+    // Evict least recently used entries once over capacity
+    while (this.cache.size > this.maxEntries) {
+      const oldestKey = this.cache.keys().next().value;
+      if (oldestKey === undefined) break;
+      this.cache.delete(oldestKey);
+    }
   }
 
   get<T>(key: string): T | null {
@@ -193,6 +212,10 @@ class MemoryCache {
       return null;
     }
 
+    // Refresh recency so frequently read entries survive eviction
+    this.cache.delete(key);
+    this.cache.set(key, item);
+
     return item.value as T;
   }
 
@@ -233,9 +256,13 @@ if (typeof window !== 'undefined') {
  */
 export class StorageCache {
   private prefix: string;
+  // Whether localStorage exists cannot change after construction, so check
+  // once here instead of re-probing the global on every cache operation
+  private hasStorage: boolean;
 
   constructor(prefix: string = 'ai-tutor-cache') {
     this.prefix = prefix;
+    this.hasStorage = typeof window !== 'undefined';
   }
 
   private getKey(key: string): string {
@@ -243,7 +270,7 @@ export class StorageCache {
   }
 
   set(key: string, value: unknown, ttl: number = 3600000): void { // 1 hour default
-    if (typeof window === 'undefined') return;
+    if (!this.hasStorage) return;
 
     const expires = Date.now() + ttl;
     const item = { value, expires };
@@ -256,7 +283,7 @@ export class StorageCache {
   }
 
   get<T>(key: string): T | null {
-    if (typeof window === 'undefined') return null;
+    if (!this.hasStorage) return null;
 
     try {
       const item = localStorage.getItem(this.getKey(key));
@@ -276,7 +303,7 @@ export class StorageCache {
   }
 
   delete(key: string): void {
-    if (typeof window === 'undefined') return;
+    if (!this.hasStorage) return;
 
     try {
       localStorage.removeItem(this.getKey(key));
@@ -286,7 +313,7 @@ export class StorageCache {
   }
 
   clear(): void {
-    if (typeof window === 'undefined') return;
+    if (!this.hasStorage) return;
 
     try {
       const keys = Object.keys(localStorage);
@@ -301,7 +328,7 @@ export class StorageCache {
   }
 
   cleanup(): void {
-    if (typeof window === 'undefined') return;
+    if (!this.hasStorage) return;
 
     try {
       const keys = Object.keys(localStorage);
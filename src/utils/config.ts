@@ -0,0 +1,15 @@
+/**
+ * Application configuration resolved once at module load
+ *
+ * Environment values cannot change while the process is running, so modules
+ * should read them from this frozen snapshot instead of re-deriving their
+ * own defaults from process.env at each call site.
+ */
+export const appConfig = Object.freeze({
+  // Public API URL for client-visible data fetching (mocked until the
+  // Next.js API routes land)
+  apiBaseUrl: process.env.NEXT_PUBLIC_API_URL || 'http://localhost:3000',
+  // Canonical site URL used for metadata and absolute links
+  baseUrl: process.env.NEXT_PUBLIC_BASE_URL || 'http://localhost:3000',
+  isDevelopment: process.env.NODE_ENV === 'development',
+});
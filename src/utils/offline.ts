@@ -11,6 +11,9 @@ export interface OfflineAction {
   maxRetries: number;
 }
 
+// Shared headers for sync requests; built once instead of per message
+const JSON_HEADERS = { 'Content-Type': 'application/json' } as const;
+
 export interface OfflineData {
   learningProgress: Record<string, unknown>;
   chatHistory: Record<string, unknown[]>;
@@ -343,7 +346,7 @@ export class OfflineSyncManager {
   private async syncChatMessage(payload: unknown): Promise<void> {
     const response = await fetch('/api/chat/send', {
       method: 'POST',
-      headers: { 'Content-Type': 'application/json' },
+      headers: JSON_HEADERS,
       body: JSON.stringify(payload),
     });
 
@@ -358,7 +361,7 @@ export class OfflineSyncManager {
   private async syncProgress(payload: unknown): Promise<void> {
     const response = await fetch('/api/progress/update', {
       method: 'POST',
-      headers: { 'Content-Type': 'application/json' },
+      headers: JSON_HEADERS,
       body: JSON.stringify(payload),
     });
 
@@ -373,7 +376,7 @@ export class OfflineSyncManager {
   private async syncAssessment(payload: unknown): Promise<void> {
     const response = await fetch('/api/assessment/submit', {
       method: 'POST',
-      headers: { 'Content-Type': 'application/json' },
+      headers: JSON_HEADERS,
       body: JSON.stringify(payload),
     });
 
@@ -388,7 +391,7 @@ export class OfflineSyncManager {
   private async syncPreferences(payload: unknown): Promise<void> {
     const response = await fetch('/api/preferences/update', {
       method: 'POST',
-      headers: { 'Content-Type': 'application/json' },
+      headers: JSON_HEADERS,
       body: JSON.stringify(payload),
     });
 
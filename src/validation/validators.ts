@@ -1,4 +1,4 @@
-import { ZodSchema, ZodError } from 'zod';
+import { ZodSchema } from 'zod';
 
 export interface ValidationResult<T> {
   success: boolean;
@@ -7,6 +7,12 @@ export interface ValidationResult<T> {
   details?: Array<{ field: string; message: string; }>;
 }
 
+// Precompiled patterns, hoisted to module scope so hot validation paths
+// don't re-create them on every call
+const ARRAY_KEY_REGEX = /^([^[]+)\[(\d+)\]$/;
+const UUID_REGEX = /^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$/i;
+const EMAIL_REGEX = /^[^\s@]+@[^\s@]+\.[^\s@]+$/;
+
 export class ValidationError extends Error {
   constructor(
     message: string,
@@ -24,31 +30,28 @@ export function validateData<T>(
   schema: ZodSchema<T>,
   data: unknown
 ): ValidationResult<T> {
-  try {
-    const validatedData = schema.parse(data);
+  // safeParse returns a discriminated result instead of throwing, so the
+  // failure path (the common case for malformed input) costs a branch
+  // rather than exception construction and unwinding
+  const result = schema.safeParse(data);
+
+  if (result.success) {
     return {
       success: true,
-      data: validatedData,
-    };
-  } catch (error) {
-    if (error instanceof ZodError) {
-      const details = error.errors.map(err => ({
-        field: err.path.join('.'),
-        message: err.message,
-      }));
-      
-      return {
-        success: false,
-        error: 'Validation failed',
-        details,
-      };
-    }
-    
-    return {
-      success: false,
-      error: 'Unknown validation error',
+      data: result.data,
     };
   }
+
+  const details = result.error.errors.map(err => ({
+    field: err.path.join('.'),
+    message: err.message,
+  }));
+
+  return {
+    success: false,
+    error: 'Validation failed',
+    details,
+  };
 }
 
 /**
@@ -75,7 +78,7 @@ export function validateFormData<T>(
       current[keys[keys.length - 1]] = value;
     } else if (key.includes('[') && key.includes(']')) {
       // Handle arrays (e.g., "skills[0]")
-      const match = key.match(/^([^[]+)\[(\d+)\]$/);
+      const match = key.match(ARRAY_KEY_REGEX);
       if (match) {
         const [, arrayName, index] = match;
         if (!data[arrayName]) {
@@ -125,16 +128,14 @@ export function sanitizeInput(input: string): string {
  * Validates UUID format
  */
 export function isValidUUID(uuid: string): boolean {
-  const uuidRegex = /^[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$/i;
-  return uuidRegex.test(uuid);
+  return UUID_REGEX.test(uuid);
 }
 
 /**
  * Validates email format
  */
 export function isValidEmail(email: string): boolean {
-  const emailRegex = /^[^\s@]+@[^\s@]+\.[^\s@]+$/;
-  return emailRegex.test(email);
+  return EMAIL_REGEX.test(email);
 }
 
 /**